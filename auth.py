@@ -16,31 +16,27 @@ from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 
 sys.path.insert(0, "src")
-from music_collector.config import (
-    SPOTIFY_CLIENT_ID,
-    SPOTIFY_CLIENT_SECRET,
-    SPOTIFY_REDIRECT_URI,
-    SPOTIFY_CACHE_PATH,
-)
-
-import spotipy
-from spotipy.oauth2 import SpotifyOAuth
 
 # 播放清單讀寫權限
 SCOPE = "playlist-modify-public playlist-modify-private"
 
-# 由回呼處理器設定
-auth_code = None
+
+class CallbackServer(HTTPServer):
+    """接收 OAuth 回呼的 HTTP 伺服器，授權碼保存在 auth_code 屬性。"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.auth_code: str | None = None
 
 
 class CallbackHandler(BaseHTTPRequestHandler):
     """處理 Spotify OAuth 回呼的 HTTP 請求處理器。"""
 
     def do_GET(self):
-        global auth_code
         query = parse_qs(urlparse(self.path).query)
         auth_code = query.get("code", [None])[0]
         error = query.get("error", [None])[0]
+        self.server.auth_code = auth_code
 
         # 回應瀏覽器
         self.send_response(200)
@@ -56,10 +52,21 @@ class CallbackHandler(BaseHTTPRequestHandler):
 
 
 def main():
+    from music_collector.config import (
+        SPOTIFY_CLIENT_ID,
+        SPOTIFY_CLIENT_SECRET,
+        SPOTIFY_REDIRECT_URI,
+        SPOTIFY_CACHE_PATH,
+    )
+
     if not SPOTIFY_CLIENT_ID or not SPOTIFY_CLIENT_SECRET:
         print("錯誤：請在 .env 中設定 SPOTIFY_CLIENT_ID 和 SPOTIFY_CLIENT_SECRET")
         sys.exit(1)
 
+    # 延遲載入 spotipy（連帶載入 requests / urllib3），設定缺漏時不必付出匯入成本
+    import spotipy
+    from spotipy.oauth2 import SpotifyOAuth
+
     auth_manager = SpotifyOAuth(
         client_id=SPOTIFY_CLIENT_ID,
         client_secret=SPOTIFY_CLIENT_SECRET,
@@ -83,7 +90,7 @@ def main():
     port = parsed.port or 8888
 
     # 啟動本機 HTTP 伺服器接收回呼
-    server = HTTPServer(("127.0.0.1", port), CallbackHandler)
+    server = CallbackServer(("127.0.0.1", port), CallbackHandler)
     server.timeout = 120  # 等待授權的逾時秒數
 
     auth_url = auth_manager.get_authorize_url()
@@ -92,9 +99,12 @@ def main():
     print(f"等待授權中（埠 {port}）...")
     webbrowser.open(auth_url)
 
-    # 等待一個 HTTP 請求（即 Spotify 的回呼）
-    server.handle_request()
-    server.server_close()
+    # 等待一個 HTTP 請求（即 Spotify 的回呼）；逾時或出錯都會釋放埠號
+    try:
+        server.handle_request()
+    finally:
+        server.server_close()
+    auth_code = server.auth_code
 
     if not auth_code:
         print("錯誤：未收到授權碼。")
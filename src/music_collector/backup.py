@@ -1,12 +1,16 @@
-"""季度 JSON 備份模組：將新曲目追加至 data/backups/YYYY/QN.json。
+"""季度 JSONL 備份模組：將新曲目追加至 data/backups/YYYY/QN.jsonl。
 
-每次執行後呼叫 save_backup()，自動建立目錄、讀取既有檔案、合併去重後寫回。
+每次執行後呼叫 save_backup()，自動建立目錄、串流讀取既有紀錄去重後，
+以追加模式寫入新曲目（每行一筆 JSON），寫入成本與季度檔案大小無關。
+舊版整檔 JSON 陣列格式（QN.json）仍可讀取，當季檔案會在首次寫入時轉換。
 亦提供 list_backups() / show_backup() 供 CLI 檢視備份內容。
 """
 
 import json
 import logging
+import sys
 from collections import Counter
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -15,6 +19,110 @@ from .scrapers.base import Track
 
 logger = logging.getLogger(__name__)
 
+# 備份副檔名：.jsonl 為現行格式，.json 為舊版整檔陣列格式
+BACKUP_SUFFIXES = (".jsonl", ".json")
+
+# 共用編碼器：json.dumps() 帶非預設參數時每次呼叫都會重建 JSONEncoder
+_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+# backup_files() 快取：(目錄狀態鍵, 排序後的備份檔清單)
+_files_cache: tuple[tuple, list[Path]] | None = None
+
+
+def _backup_dir_key() -> tuple:
+    """以備份根目錄與各年度子目錄的 mtime 組成快取鍵。
+
+    新增或刪除季度檔案會改變所在年度目錄的 mtime，因此需一併納入。
+    """
+    if not BACKUP_DIR.exists():
+        return (str(BACKUP_DIR),)
+    years = sorted(
+        (d.name, d.stat().st_mtime_ns) for d in BACKUP_DIR.iterdir() if d.is_dir()
+    )
+    return (str(BACKUP_DIR), BACKUP_DIR.stat().st_mtime_ns, *years)
+
+
+def backup_files() -> list[Path]:
+    """列出所有季度備份檔案（含舊版 .json），依路徑排序。
+
+    目錄未變動時重用上次的遞迴掃描結果。
+    """
+    global _files_cache
+
+    key = _backup_dir_key()
+    if _files_cache is None or _files_cache[0] != key:
+        files = (
+            sorted(
+                f for f in BACKUP_DIR.glob("**/Q*.json*") if f.suffix in BACKUP_SUFFIXES
+            )
+            if BACKUP_DIR.exists()
+            else []
+        )
+        _files_cache = (key, files)
+    return list(_files_cache[1])
+
+
+def _intern_source(record: dict) -> dict:
+    """共用來源名稱字串：整季數千筆紀錄僅有十餘種 source 值。"""
+    source = record.get("source")
+    if isinstance(source, str):
+        record["source"] = sys.intern(source)
+    return record
+
+
+def iter_backup(path: Path) -> Iterator[dict]:
+    """逐筆讀取備份紀錄。JSONL 逐行串流解析；舊版 .json 整檔解析。
+
+    JSONL 中無法解析的行（如寫入中斷留下的半行）記錄警告後略過，
+    不影響其餘紀錄。
+    """
+    if path.suffix == ".json":
+        for record in json.loads(path.read_text(encoding="utf-8")):
+            yield _intern_source(record)
+        return
+    with path.open(encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.warning(f"備份檔案 {path.name} 第 {lineno} 行損毀，已略過：{e}")
+                continue
+            yield _intern_source(record)
+
+
+def _ends_with_newline(path: Path) -> bool:
+    """檔案是否為空或以換行結尾（追加前檢查，避免新紀錄接在被截斷的行後）。"""
+    with path.open("rb") as f:
+        if f.seek(0, 2) == 0:
+            return True
+        f.seek(-1, 2)
+        return f.read(1) == b"\n"
+
+
+def load_backup(path: Path) -> list[dict]:
+    """讀取備份檔案全部紀錄。"""
+    return list(iter_backup(path))
+
+
+def _migrate_legacy_backup(legacy_file: Path, backup_file: Path) -> None:
+    """將舊版 JSON 陣列備份轉為 JSONL（僅在 JSONL 檔尚不存在時執行）。"""
+    if not legacy_file.exists() or backup_file.exists():
+        return
+    try:
+        entries = json.loads(legacy_file.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning(f"舊版備份轉換失敗，保留原檔：{e}")
+        return
+    backup_file.write_text(
+        "".join(_ENCODER.encode(e) + "\n" for e in entries),
+        encoding="utf-8",
+    )
+    legacy_file.unlink()
+    logger.info(f"已將舊版備份 {legacy_file.name} 轉換為 {backup_file.name}")
+
 
 def save_backup(
     tracks: list[Track],
@@ -33,52 +141,56 @@ def save_backup(
     quarter = get_quarter(now.month)
     year_dir = BACKUP_DIR / str(now.year)
     year_dir.mkdir(parents=True, exist_ok=True)
-    backup_file = year_dir / f"Q{quarter}.json"
+    backup_file = year_dir / f"Q{quarter}.jsonl"
+    _migrate_legacy_backup(backup_file.with_suffix(".json"), backup_file)
 
-    # 讀取現有備份
-    existing: list[dict] = []
+    # 串流讀取現有備份，建立去重索引（以小寫 artist + title 為鍵）；
+    # 損毀的行由 iter_backup() 略過，讀取中途失敗時保留已讀到的鍵
+    seen: set[tuple[str, str]] = set()
     if backup_file.exists():
         try:
-            existing = json.loads(backup_file.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError) as e:
-            logger.warning(f"備份檔案讀取失敗，將覆寫：{e}")
-
-    # 建立去重索引（以小寫 artist + title 為鍵）
-    seen = {(e["artist"].lower(), e["title"].lower()) for e in existing}
-
-    # 追加新曲目
-    added = 0
+            for e in iter_backup(backup_file):
+                seen.add((e["artist"].lower(), e["title"].lower()))
+        except OSError as e:
+            logger.warning(f"備份檔案讀取失敗，僅以已讀取的紀錄去重：{e}")
+
+    # 先收集新曲目的 JSONL 行，同批曲目共用同一時間戳
+    added_at = now.isoformat()
+    new_entries: list[str] = []
     for track in tracks:
-        key = (track.artist.lower(), track.title.lower())
+        key = (track.artist.lower(), track.title.lower())  # 每首僅計算一次
         if key in seen:
             continue
         seen.add(key)
 
         uri = spotify_results.get((track.artist, track.title))
-        existing.append({
+        record = {
             "artist": track.artist,
             "title": track.title,
             "source": track.source,
             "spotify_uri": uri,
-            "added_at": now.isoformat(),
-        })
-        added += 1
+            "added_at": added_at,
+        }
+        new_entries.append(_ENCODER.encode(record) + "\n")
 
-    # 寫回檔案
-    backup_file.write_text(
-        json.dumps(existing, ensure_ascii=False, indent=2) + "\n",
-        encoding="utf-8",
-    )
-    logger.info(f"備份完成：新增 {added} 首至 {backup_file}")
+    # 以追加模式一次寫入（每行一筆）；無新曲目時不開啟檔案
+    if new_entries:
+        # 上次寫入中斷時最後一行缺少換行，先補上以免新紀錄與其黏成同一行
+        if backup_file.exists() and not _ends_with_newline(backup_file):
+            new_entries.insert(0, "\n")
+        with backup_file.open("a", encoding="utf-8") as f:
+            f.writelines(new_entries)
+
+    # 可能新建了季度檔案：不依賴 mtime 解析度，直接讓清單快取失效
+    global _files_cache
+    _files_cache = None
+
+    logger.info(f"備份完成：新增 {len(new_entries)} 首至 {backup_file}")
 
 
 def list_backups() -> None:
     """列出所有備份檔案及其曲目數量。"""
-    if not BACKUP_DIR.exists():
-        print("尚無備份資料。")
-        return
-
-    files = sorted(BACKUP_DIR.glob("**/Q*.json"))
+    files = backup_files()
     if not files:
         print("尚無備份資料。")
         return
@@ -86,10 +198,13 @@ def list_backups() -> None:
     print("\n可用的備份檔案：\n")
     for f in files:
         try:
-            data = json.loads(f.read_text(encoding="utf-8"))
-            matched = sum(1 for t in data if t.get("spotify_uri"))
+            # 單次串流計數，不在記憶體中建立整季紀錄清單
+            total = matched = 0
+            for t in iter_backup(f):
+                total += 1
+                matched += bool(t.get("spotify_uri"))
             label = f"{f.parent.name}/{f.stem}"
-            print(f"  {label}  —  {len(data)} 首（Spotify 配對 {matched} 首）")
+            print(f"  {label}  —  {total} 首（Spotify 配對 {matched} 首）")
         except (json.JSONDecodeError, OSError):
             print(f"  {f.relative_to(BACKUP_DIR)}  —  讀取失敗")
 
@@ -103,7 +218,7 @@ def show_backup(query: str) -> None:
     q = query.upper().replace("/", "").replace("-", "").strip()
 
     # 嘗試各種匹配
-    candidates = sorted(BACKUP_DIR.glob("**/Q*.json"))
+    candidates = backup_files()
     target: Path | None = None
     for f in candidates:
         label = f"{f.parent.name}{f.stem}".upper()
@@ -116,19 +231,25 @@ def show_backup(query: str) -> None:
         print("可用備份：", ", ".join(f"{f.parent.name}/{f.stem}" for f in candidates) or "無")
         return
 
+    # 單次走訪：同時累計配對數、來源分布並組出明細行，最後一次輸出
+    total = matched = 0
+    sources: Counter[str] = Counter()
+    lines: list[str] = []
     try:
-        data = json.loads(target.read_text(encoding="utf-8"))
+        for total, t in enumerate(iter_backup(target), 1):
+            found = bool(t.get("spotify_uri"))
+            matched += found
+            sources[t["source"]] += 1
+            status = "✓" if found else "✗"
+            lines.append(
+                f"  {total:3d}. [{status}] [{t['source']}] {t['artist']} — {t['title']}"
+            )
     except (json.JSONDecodeError, OSError) as e:
         print(f"備份讀取失敗：{e}")
         return
 
     label = f"{target.parent.name}/{target.stem}"
-    matched = sum(1 for t in data if t.get("spotify_uri"))
-    sources = Counter(t["source"] for t in data)
-
-    print(f"\n{label} 備份（共 {len(data)} 首，Spotify 配對 {matched} 首）")
+    print(f"\n{label} 備份（共 {total} 首，Spotify 配對 {matched} 首）")
     print(f"來源分布：{', '.join(f'{s} {c}' for s, c in sources.most_common())}\n")
-
-    for i, t in enumerate(data, 1):
-        status = "✓" if t.get("spotify_uri") else "✗"
-        print(f"  {i:3d}. [{status}] [{t['source']}] {t['artist']} — {t['title']}")
+    if lines:
+        print("\n".join(lines))
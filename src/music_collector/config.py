@@ -22,16 +22,22 @@ PLAYLIST_DESCRIPTION = (
     "等 13 家樂評媒體的最新推薦曲目。由 Music Collector 自動更新。"
 )
 
+# ── Spotify 搜尋設定 ──
+SPOTIFY_SEARCH_WORKERS = 8  # 同時進行的搜尋執行緒數
+SPOTIFY_SEARCH_RATE = 20  # 每秒搜尋請求上限（低於 Spotify 約 25 req/s 的限制）
+
 # ── 檔案路徑 ──
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent  # 專案根目錄
 DATA_DIR = PROJECT_ROOT / "data"  # 資料存放目錄
 DB_PATH = DATA_DIR / "tracks.db"  # SQLite 資料庫路徑
 SPOTIFY_CACHE_PATH = PROJECT_ROOT / ".spotify_cache"  # Spotify OAuth Token 快取
+FEED_CACHE_DIR = DATA_DIR / "feed_cache"  # RSS 條件式請求快取（ETag / Last-Modified）
 
 # ── LINE Messaging API 憑證（選用）──
 LINE_CHANNEL_ID = os.environ.get("LINE_CHANNEL_ID", "")
 LINE_CHANNEL_SECRET = os.environ.get("LINE_CHANNEL_SECRET", "")
 LINE_USER_ID = os.environ.get("LINE_USER_ID", "")
+LINE_TOKEN_CACHE_PATH = PROJECT_ROOT / ".line_token_cache"  # LINE Access Token 快取
 
 # ── 備份設定 ──
 BACKUP_DIR = DATA_DIR / "backups"
@@ -1,19 +1,58 @@
 """資料庫模組：SQLite 曲目紀錄與去重。
 
-資料表 tracks 以 (artist, title) 為唯一鍵，確保同一首曲目不會重複寫入。
+資料表 tracks 以 (artist, title) 為唯一鍵，確保同一首曲目不會重複寫入；
+另存正規化曲目鍵（norm_key），讓不同寫法的同一首歌（大小寫、變音符號、
+標點、feat.）也能在資料庫層級去重。
 """
 
+import atexit
+import os
+import re
 import sqlite3
+import unicodedata
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from typing import NamedTuple
 
 from .config import DATA_DIR, DB_PATH
 
+# 行程內共用的連線，以 (pid, 資料庫路徑) 識別，fork 後的子行程會重新開啟
+_conn: sqlite3.Connection | None = None
+_conn_key: tuple[int, str] | None = None
+
+
+class RecentTrack(NamedTuple):
+    """get_recent_tracks() 回傳的曲目紀錄。"""
+
+    artist: str
+    title: str
+    source: str
+    spotify_uri: str | None
+    added_at: str
+
 
 def init_db() -> sqlite3.Connection:
-    """初始化資料庫連線，自動建立 tracks 與 source_checks 資料表（若不存在）。"""
+    """初始化資料庫連線，自動建立 tracks 與 source_checks 資料表（若不存在）。
+
+    同一行程內重複呼叫會回傳同一條連線；呼叫端不需自行關閉，
+    由 close_db() 統一關閉（行程結束時自動執行）。
+    """
+    global _conn, _conn_key
+
+    key = (os.getpid(), str(DB_PATH))
+    if _conn is not None and _conn_key == key:
+        return _conn
+
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row
+    # WAL 模式：commit 僅需追加寫入 WAL 檔，讀取不會被寫入阻擋
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")  # WAL 下 NORMAL 已可保證資料庫一致性
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=134217728")  # 128 MB
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MB（負值單位為 KiB）
     conn.execute("""
         CREATE TABLE IF NOT EXISTS tracks (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -22,9 +61,13 @@ def init_db() -> sqlite3.Connection:
             source TEXT NOT NULL,       -- 來源媒體（如 Stereogum、SPIN 等）
             spotify_uri TEXT,           -- Spotify 曲目 URI（未找到為 NULL）
             added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            norm_key TEXT,              -- 正規化的「藝人\x1f曲名」，見 norm_key()
             UNIQUE(artist, title)       -- 去重：同一藝人+曲名只存一筆
         )
     """)
+    _migrate_norm_key(conn)
+    # 去重已改走 idx_tracks_norm_key，移除舊版的 LOWER() 運算式索引以免每次寫入空轉維護
+    conn.execute("DROP INDEX IF EXISTS idx_tracks_lower")
     conn.execute("""
         CREATE TABLE IF NOT EXISTS source_checks (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -40,16 +83,110 @@ def init_db() -> sqlite3.Connection:
         ON source_checks(source, checked_at DESC)
     """)
     conn.commit()
+    _conn, _conn_key = conn, key
     return conn
 
 
-def track_exists(conn: sqlite3.Connection, artist: str, title: str) -> bool:
-    """檢查曲目是否已存在於資料庫中（大小寫不敏感比對）。"""
-    row = conn.execute(
-        "SELECT 1 FROM tracks WHERE LOWER(artist) = LOWER(?) AND LOWER(title) = LOWER(?)",
-        (artist.strip(), title.strip()),
-    ).fetchone()
-    return row is not None
+def _migrate_norm_key(conn: sqlite3.Connection) -> None:
+    """為舊版資料庫加上 norm_key 欄位與索引，並補齊尚未計算的列。"""
+    columns = {r["name"] for r in conn.execute("PRAGMA table_info(tracks)")}
+    if "norm_key" not in columns:
+        conn.execute("ALTER TABLE tracks ADD COLUMN norm_key TEXT")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_tracks_norm_key ON tracks(norm_key)")
+    rows = conn.execute(
+        "SELECT id, artist, title FROM tracks WHERE norm_key IS NULL"
+    ).fetchall()
+    if rows:
+        conn.executemany(
+            "UPDATE tracks SET norm_key = ? WHERE id = ?",
+            [(norm_key(r["artist"], r["title"]), r["id"]) for r in rows],
+        )
+
+
+def close_db() -> None:
+    """關閉共用連線；下次呼叫 init_db() 時重新開啟。"""
+    global _conn, _conn_key
+
+    # 僅關閉本行程開啟的連線，不碰 fork 前繼承而來的連線
+    if _conn is not None and _conn_key is not None and _conn_key[0] == os.getpid():
+        _conn.close()
+    _conn = _conn_key = None
+
+
+atexit.register(close_db)
+
+
+@contextmanager
+def writer(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """寫入交易範圍：區塊內的所有寫入於離開時一次 commit，發生例外則 rollback。
+
+    用法：
+        with writer(conn):
+            save_track(conn, ...)
+            save_track(conn, ...)
+    """
+    try:
+        yield conn
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+# 客串標記：藝人欄位取其前段；曲名中的「(feat. X)」或結尾「feat. X」整段移除
+_FEAT_SPLIT_RE = re.compile(r"\s+(?:feat(?:uring)?|ft)\.?\s+", re.IGNORECASE)
+_FEAT_TITLE_RE = re.compile(
+    r"\s*(?:[(\[]\s*(?:feat(?:uring)?|ft)\.?\s[^)\]]*[)\]]|\s(?:feat(?:uring)?|ft)\.?\s.*$)",
+    re.IGNORECASE,
+)
+
+
+def _normalize_text(text: str) -> str:
+    """正規化文字：去除變音符號與標點、轉小寫、合併空白。
+
+    僅由標點組成的名稱（如樂團「!!!」）正規化後為空字串，
+    此時改用小寫原字串，避免所有這類名稱共用同一個鍵。
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    kept = "".join(
+        c for c in decomposed
+        if (c.isalnum() and not unicodedata.combining(c)) or c.isspace()
+    )
+    return " ".join(kept.lower().split()) or " ".join(text.lower().split())
+
+
+def track_key(artist: str, title: str) -> tuple[str, str]:
+    """跨來源去重用的曲目鍵，忽略大小寫、變音符號、標點與客串標記。
+
+    其他括號內容（如 Remix、Live）代表不同版本，予以保留。
+    """
+    artist = _FEAT_SPLIT_RE.split(artist, maxsplit=1)[0]
+    title = _FEAT_TITLE_RE.sub("", title)
+    return _normalize_text(artist), _normalize_text(title)
+
+
+def norm_key(artist: str, title: str) -> str:
+    """以 \\x1f 連接的正規化曲目鍵，存於 tracks.norm_key。"""
+    return "\x1f".join(track_key(artist, title))
+
+
+# 每批查詢的曲目鍵數上限（需低於 SQLite 的參數數量限制 999）
+_EXISTS_BATCH = 400
+
+
+def existing_norm_keys(conn: sqlite3.Connection, keys: list[str]) -> set[str]:
+    """批次查詢哪些正規化曲目鍵已存在於 tracks（走 idx_tracks_norm_key 索引）。"""
+    keys = list(dict.fromkeys(keys))
+    found: set[str] = set()
+    for i in range(0, len(keys), _EXISTS_BATCH):
+        batch = keys[i : i + _EXISTS_BATCH]
+        placeholders = ", ".join(["?"] * len(batch))
+        rows = conn.execute(
+            f"SELECT DISTINCT norm_key FROM tracks WHERE norm_key IN ({placeholders})",
+            batch,
+        ).fetchall()
+        found.update(r[0] for r in rows)
+    return found
 
 
 def save_track(
@@ -59,19 +196,45 @@ def save_track(
     source: str,
     spotify_uri: str | None,
 ) -> None:
-    """儲存曲目至資料庫。若已存在（UNIQUE 衝突）則忽略。"""
+    """儲存曲目至資料庫。若已存在（UNIQUE 衝突）則忽略。
+
+    不會自動 commit，需在 writer() 區塊內呼叫，由區塊結束時統一提交。
+    """
     conn.execute(
-        "INSERT OR IGNORE INTO tracks (artist, title, source, spotify_uri) VALUES (?, ?, ?, ?)",
-        (artist.strip(), title.strip(), source, spotify_uri),
+        "INSERT OR IGNORE INTO tracks (artist, title, source, spotify_uri, norm_key) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (artist.strip(), title.strip(), source, spotify_uri, norm_key(artist, title)),
     )
-    conn.commit()
 
 
-def get_recent_tracks(conn: sqlite3.Connection, days: int = 7) -> list[dict]:
+def save_tracks(
+    conn: sqlite3.Connection,
+    tracks: list[tuple[str, str, str, str | None]],
+) -> None:
+    """批次儲存曲目，所有 INSERT 在單一交易中完成（僅一次 commit）。
+
+    Args:
+        conn: 資料庫連線。
+        tracks: [(artist, title, source, spotify_uri), ...] 清單。
+    """
+    if not tracks:
+        return
+    with conn:
+        conn.executemany(
+            "INSERT OR IGNORE INTO tracks (artist, title, source, spotify_uri, norm_key) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [(a.strip(), t.strip(), s, u, norm_key(a, t)) for a, t, s, u in tracks],
+        )
+
+
+def get_recent_tracks(conn: sqlite3.Connection, days: int = 7) -> list[RecentTrack]:
     """查詢最近 N 天內蒐集的曲目，依加入時間降序排列。"""
     cutoff = (datetime.now() - timedelta(days=days)).isoformat()
-    rows = conn.execute(
+    # 此查詢改用純 tuple 列，直接建構 NamedTuple，省去 sqlite3.Row → dict 的轉換
+    cur = conn.cursor()
+    cur.row_factory = None
+    rows = cur.execute(
         "SELECT artist, title, source, spotify_uri, added_at FROM tracks WHERE added_at >= ? ORDER BY added_at DESC",
         (cutoff,),
     ).fetchall()
-    return [dict(r) for r in rows]
+    return list(map(RecentTrack._make, rows))
@@ -12,6 +12,7 @@ import re
 from datetime import datetime
 from pathlib import Path
 
+from .backup import BACKUP_SUFFIXES, backup_files, load_backup
 from .config import BACKUP_DIR, PLAYLIST_NAME
 from .spotify import get_spotify_client, get_or_create_playlist
 
@@ -20,6 +21,18 @@ logger = logging.getLogger(__name__)
 # 匯出檔案目錄
 EXPORT_DIR = BACKUP_DIR.parent / "exports"
 
+# 檔名中不允許的字元 → 底線（str.translate 單次 C 層級轉換，無需 regex）
+_UNSAFE_FILENAME_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', "_"))
+
+# 完整季度標籤（如 2026Q1），可直接組出備份路徑
+_FULL_QUARTER_RE = re.compile(r"^(\d{4})Q([1-4])$")
+
+# 匯出檔案寫入緩衝區大小（整份匯出通常一次 flush 即完成）
+_WRITE_BUFFER = 1 << 20
+
+# _find_backup() 索引快取：(備份檔清單, {查詢標籤: 備份路徑})
+_backup_index: tuple[tuple[Path, ...], dict[str, Path]] | None = None
+
 
 def export_combined_spotify(playlist_name: str | None = None) -> Path | None:
     """合併 Spotify 主歌單與所有歸檔歌單，匯出為單一 CSV 與 Apple Music 手動匯入 TXT 檔。
@@ -93,25 +106,26 @@ def export_combined_spotify(playlist_name: str | None = None) -> Path | None:
             unique.append((artist, title, album))
 
     EXPORT_DIR.mkdir(parents=True, exist_ok=True)
-    safe_name = re.sub(r'[<>:"/\\|?*]', "_", name)
+    safe_name = name.translate(_UNSAFE_FILENAME_CHARS)
     export_path = EXPORT_DIR / f"{safe_name}.csv"
     export_txt_path = EXPORT_DIR / f"{safe_name}_Apple_Music.txt"
 
     # 寫入 CSV
-    with export_path.open("w", newline="", encoding="utf-8") as f:
+    with export_path.open(
+        "w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER
+    ) as f:
         writer = csv.writer(f)
-        writer.writerow(["Artist", "Title"])
-        for artist, title, album in unique:
-            writer.writerow([artist, title])
+        writer.writerow(("Artist", "Title"))
+        writer.writerows((artist, title) for artist, title, _ in unique)
 
     # 寫入 Apple Music 手動匯入 TXT (Tab-separated)
-    with export_txt_path.open("w", encoding="utf-8") as f:
-        f.write("Name\tArtist\tAlbum\n")
-        for artist, title, album in unique:
-            t_title = title.replace("\t", " ").replace("\n", " ").replace("\r", " ")
-            t_artist = artist.replace("\t", " ").replace("\n", " ").replace("\r", " ")
-            t_album = album.replace("\t", " ").replace("\n", " ").replace("\r", " ")
-            f.write(f"{t_title}\t{t_artist}\t{t_album}\n")
+    lines = ["Name\tArtist\tAlbum\n"]
+    for artist, title, album in unique:
+        t_title = title.replace("\t", " ").replace("\n", " ").replace("\r", " ")
+        t_artist = artist.replace("\t", " ").replace("\n", " ").replace("\r", " ")
+        t_album = album.replace("\t", " ").replace("\n", " ").replace("\r", " ")
+        lines.append(f"{t_title}\t{t_artist}\t{t_album}\n")
+    export_txt_path.write_text("".join(lines), encoding="utf-8")
 
     print(
         f"\n✅ 已合併匯出 {len(unique)} 首曲目（原始 {len(all_tracks)} 首，去重後 {len(unique)} 首）"
@@ -128,22 +142,37 @@ def _find_backup(query: str) -> Path | None:
     query 格式：'Q1'、'2026Q1'、'2026/Q1' 皆可。
     若僅指定 Q1-Q4，則預設為當年。
     """
-    q = query.upper().replace("/", "").replace("-", "").strip()
-
-    candidates = sorted(BACKUP_DIR.glob("**/Q*.json"))
+    global _backup_index
 
-    for f in candidates:
-        label = f"{f.parent.name}{f.stem}".upper()
-        if q == label or q == f.stem.upper():
-            return f
+    q = query.upper().replace("/", "").replace("-", "").strip()
 
-    return None
+    # 快速路徑：完整季度標籤直接組出路徑，不需掃描目錄
+    # （依 .json → .jsonl 順序檢查，與排序掃描的結果一致）
+    m = _FULL_QUARTER_RE.match(q)
+    if m:
+        year_dir = BACKUP_DIR / m.group(1)
+        for suffix in sorted(BACKUP_SUFFIXES):
+            path = year_dir / f"Q{m.group(2)}{suffix}"
+            if path.exists():
+                return path
+
+    # 備份清單未變動時重用索引（backup_files() 本身已依目錄 mtime 快取）
+    files = tuple(backup_files())
+    if _backup_index is None or _backup_index[0] != files:
+        index: dict[str, Path] = {}
+        for f in files:
+            # setdefault：同名標籤以排序最前者為準（與逐一比對的結果相同）
+            index.setdefault(f"{f.parent.name}{f.stem}".upper(), f)
+            index.setdefault(f.stem.upper(), f)
+        _backup_index = (files, index)
+
+    return _backup_index[1].get(q)
 
 
 def _load_backup(path: Path) -> list[dict]:
     """讀取備份檔案內容。"""
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return load_backup(path)
     except (json.JSONDecodeError, OSError) as e:
         logger.error(f"備份讀取失敗：{e}")
         return []
@@ -186,7 +215,7 @@ def export_csv(
     # 使用播放清單名稱作為檔名（TuneMyMusic 會使用檔名作為歌單名稱）
     if playlist_name:
         # 移除檔名中不允許的字元
-        safe_name = re.sub(r'[<>:"/\\|?*]', "_", playlist_name)
+        safe_name = playlist_name.translate(_UNSAFE_FILENAME_CHARS)
         export_path = EXPORT_DIR / f"{safe_name}.csv"
     else:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -194,11 +223,12 @@ def export_csv(
         export_path = EXPORT_DIR / f"{label}_{timestamp}.csv"
 
     # 寫入 CSV
-    with export_path.open("w", newline="", encoding="utf-8") as f:
+    with export_path.open(
+        "w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER
+    ) as f:
         writer = csv.writer(f)
-        writer.writerow(["Artist", "Title"])
-        for t in data:
-            writer.writerow([t["artist"], t["title"]])
+        writer.writerow(("Artist", "Title"))
+        writer.writerows((t["artist"], t["title"]) for t in data)
 
     print(f"\n✅ 已匯出 {len(data)} 首曲目至：")
     print(f"   {export_path}")
@@ -314,7 +344,7 @@ def export_spotify_url() -> None:
 
 def _show_available_backups() -> None:
     """顯示可用的備份檔案。"""
-    candidates = sorted(BACKUP_DIR.glob("**/Q*.json"))
+    candidates = backup_files()
     if candidates:
         available = ", ".join(f"{f.parent.name}/{f.stem}" for f in candidates)
         print(f"可用備份：{available}")
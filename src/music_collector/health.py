@@ -54,7 +54,10 @@ def record_scrape_result(
     track_count: int,
     error: str | None = None,
 ) -> None:
-    """記錄單次擷取結果到資料庫。"""
+    """記錄單次擷取結果到資料庫。
+
+    不會自動 commit，需在 db.writer() 區塊內呼叫。
+    """
     if error:
         status = "failure"
     elif track_count == 0:
@@ -66,7 +69,6 @@ def record_scrape_result(
         "INSERT INTO source_checks (source, status, track_count, error_message) VALUES (?, ?, ?, ?)",
         (source, status, track_count, error),
     )
-    conn.commit()
 
 
 def _count_consecutive_failures(conn: sqlite3.Connection, source: str) -> int:
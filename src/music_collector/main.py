@@ -13,8 +13,9 @@
 """
 
 import argparse
-import asyncio
 import logging
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .backup import list_backups, save_backup, show_backup
@@ -24,8 +25,20 @@ from .export import (
     export_spotify_url,
 )
 from .stats import show_stats
-from .config import DB_PATH, PLAYLIST_NAME
-from .db import init_db, save_track, track_exists, get_recent_tracks
+from .config import (
+    DB_PATH,
+    PLAYLIST_NAME,
+    SPOTIFY_SEARCH_WORKERS,
+)
+from .db import (
+    close_db,
+    existing_norm_keys,
+    get_recent_tracks,
+    init_db,
+    norm_key,
+    save_tracks,
+    writer,
+)
 from .health import (
     get_health_report,
     get_unhealthy_sources,
@@ -38,8 +51,8 @@ from .notify import (
     send_notification,
     send_source_health_notification,
 )
-from .scrapers import ALL_SCRAPERS
-from .scrapers.base import Track
+from .scrapers import iter_scrapers, scraper_classes
+from .scrapers.base import Track, close_browser
 from .spotify import (
     add_tracks_to_playlist,
     archive_previous_quarters,
@@ -135,38 +148,51 @@ def _fetch_from_scraper(scraper) -> tuple[str, list[Track], str | None]:
         return scraper.name, [], str(e)
 
 
-def collect_tracks() -> list[Track]:
+def _search_one(sp, track: Track) -> tuple[str | None, Exception | None]:
+    """搜尋單首曲目，回傳 (uri, error)。例外在執行緒內捕捉，不影響其他搜尋。"""
+    try:
+        return search_track(sp, track.artist, track.title), None
+    except Exception as e:
+        return None, e
+
+
+def collect_tracks(conn: sqlite3.Connection) -> list[Track]:
     """平行執行所有擷取器，回傳尚未紀錄的新曲目。
 
-    使用 asyncio.to_thread 將各擷取器的同步 fetch_tracks() 發送至
-    執行緒池平行執行，避免 I/O 等待時間疊加。13 個來源原本依序約需
-    30-60 秒，平行化後約 5-10 秒。
+    每個擷取器各佔一條執行緒同時執行 fetch_tracks()，避免 I/O 等待時間疊加；
+    執行緒數與來源數相同，不受預設執行緒池上限（依 CPU 核心數）限制。
+    13 個來源原本依序約需 30-60 秒，平行化後約等於最慢來源的耗時。
+    結果依註冊順序回傳，去重與資料庫寫入皆在主執行緒進行。
     同時記錄各來源健康狀態到 source_checks 資料表。
     """
+    scrapers = list(iter_scrapers())
+    try:
+        with ThreadPoolExecutor(max_workers=max(len(scrapers), 1)) as executor:
+            results = list(executor.map(_fetch_from_scraper, scrapers))
+    finally:
+        # 各擷取器共用的 Playwright 瀏覽器在全部擷取完成後關閉
+        close_browser()
 
-    async def _collect_all() -> list[tuple[str, list[Track], str | None]]:
-        tasks = [
-            asyncio.to_thread(_fetch_from_scraper, scraper) for scraper in ALL_SCRAPERS
-        ]
-        return await asyncio.gather(*tasks)
-
-    results = asyncio.run(_collect_all())
-
-    conn = init_db()
     new_tracks: list[Track] = []
-    seen_in_run: set[tuple[str, str]] = set()
 
-    for scraper_name, tracks, error in results:
-        record_scrape_result(conn, scraper_name, len(tracks), error)
-        for track in tracks:
-            key = (track.artist.strip().lower(), track.title.strip().lower())
-            if key in seen_in_run:
-                continue
-            if not track_exists(conn, track.artist, track.title):
-                new_tracks.append(track)
-                seen_in_run.add(key)
+    with writer(conn):
+        for scraper_name, tracks, error in results:
+            record_scrape_result(conn, scraper_name, len(tracks), error)
+
+    # 以正規化鍵（tracks.norm_key）一次查詢所有候選曲目是否已紀錄，
+    # 與本次已見曲目合併為同一個集合，迴圈內只需一次集合查找即可同時完成
+    # 資料庫去重與跨來源去重；同一首歌的寫法差異（大小寫、破折號、變音符號、
+    # feat.）無論出現在本次或過去的紀錄中，都只會搜尋一次
+    candidates = [
+        (norm_key(t.artist, t.title), t) for _, tracks, _ in results for t in tracks
+    ]
+    seen = existing_norm_keys(conn, [key for key, _ in candidates])
+    for key, track in candidates:
+        if key in seen:
+            continue
+        seen.add(key)
+        new_tracks.append(track)
 
-    conn.close()
     return new_tracks
 
 
@@ -180,9 +206,12 @@ def reset() -> None:
     removed = clear_playlist(sp, playlist_id)
     logger.info(f"已從 Spotify 歌單移除 {removed} 首曲目")
 
-    # 清除本地資料庫
+    # 清除本地資料庫（含 WAL 模式的 -wal / -shm 附屬檔）；先關閉共用連線
+    close_db()
     if DB_PATH.exists():
         DB_PATH.unlink()
+        for suffix in ("-wal", "-shm"):
+            DB_PATH.with_name(DB_PATH.name + suffix).unlink(missing_ok=True)
         logger.info("已刪除本地資料庫")
 
     # 重新執行完整蒐集流程
@@ -198,7 +227,9 @@ def run(dry_run: bool = False, sync_apple_music: bool = False) -> None:
     """
     logger.info("開始音樂蒐集...")
 
-    new_tracks = collect_tracks()
+    # 整個流程共用同一條資料庫連線（行程結束時由 db.close_db() 關閉）
+    conn = init_db()
+    new_tracks = collect_tracks(conn)
     logger.info(f"發現 {len(new_tracks)} 首新曲目")
 
     if not new_tracks:
@@ -234,27 +265,31 @@ def run(dry_run: bool = False, sync_apple_music: bool = False) -> None:
         except Exception as e:
             logger.warning(f"舊播放清單合併失敗：{e}")
 
-        conn = init_db()
         spotify_results: dict[tuple[str, str], str | None] = {}
+        pending_rows: list[tuple[str, str, str, str | None]] = []
 
-        # 逐首搜尋 Spotify 並儲存結果
-        for track in new_tracks:
-            try:
-                uri = search_track(sp, track.artist, track.title)
-                if uri:
-                    spotify_uris.append(uri)
-                    spotify_results[(track.artist, track.title)] = uri
-                    save_track(conn, track.artist, track.title, track.source, uri)
-                    logger.info(f"  找到：{track.artist} — {track.title}")
-                else:
-                    not_found.append(track)
-                    spotify_results[(track.artist, track.title)] = None
-                    save_track(conn, track.artist, track.title, track.source, None)
-                    logger.warning(f"  Spotify 未找到：{track.artist} — {track.title}")
-            except Exception as e:
-                logger.warning(f"  搜尋失敗：{track.artist} — {track.title}: {e}")
+        # 以多執行緒並行搜尋 Spotify（總請求速率由 spotify 模組限流），
+        # 結果依原順序在主執行緒彙整，迴圈結束後一次寫入資料庫
+        with ThreadPoolExecutor(max_workers=SPOTIFY_SEARCH_WORKERS) as executor:
+            search_results = list(
+                executor.map(lambda t: _search_one(sp, t), new_tracks)
+            )
 
-        conn.close()
+        for track, (uri, error) in zip(new_tracks, search_results):
+            if error is not None:
+                logger.warning(f"  搜尋失敗：{track.artist} — {track.title}: {error}")
+                continue
+            if uri:
+                spotify_uris.append(uri)
+                spotify_results[(track.artist, track.title)] = uri
+                logger.info(f"  找到：{track.artist} — {track.title}")
+            else:
+                not_found.append(track)
+                spotify_results[(track.artist, track.title)] = None
+                logger.warning(f"  Spotify 未找到：{track.artist} — {track.title}")
+            pending_rows.append((track.artist, track.title, track.source, uri))
+
+        save_tracks(conn, pending_rows)
 
         # 批次加入播放清單
         if spotify_uris:
@@ -286,11 +321,9 @@ def run(dry_run: bool = False, sync_apple_music: bool = False) -> None:
 
     unhealthy_sources = []
     try:
-        conn_health = init_db()
-        source_names = [s.name for s in ALL_SCRAPERS]
-        unhealthy_sources = get_unhealthy_sources(conn_health, source_names)
-        prune_old_checks(conn_health)
-        conn_health.close()
+        source_names = [cls.name for cls in scraper_classes()]
+        unhealthy_sources = get_unhealthy_sources(conn, source_names)
+        prune_old_checks(conn)
     except Exception as e:
         logger.warning(f"來源健康檢查失敗：{e}")
 
@@ -315,7 +348,6 @@ def show_recent(days: int = 7) -> None:
     """顯示最近 N 天蒐集的曲目紀錄。"""
     conn = init_db()
     tracks = get_recent_tracks(conn, days=days)
-    conn.close()
 
     if not tracks:
         print(f"最近 {days} 天內無蒐集紀錄。")
@@ -323,16 +355,15 @@ def show_recent(days: int = 7) -> None:
 
     print(f"\n最近 {days} 天蒐集的曲目（共 {len(tracks)} 首）：\n")
     for t in tracks:
-        status = "已加入 Spotify" if t["spotify_uri"] else "未找到"
-        print(f"  [{t['source']}] {t['artist']} — {t['title']} ({status})")
+        status = "已加入 Spotify" if t.spotify_uri else "未找到"
+        print(f"  [{t.source}] {t.artist} — {t.title} ({status})")
 
 
 def show_health() -> None:
     """顯示所有擷取器來源的健康狀態報告。"""
     conn = init_db()
-    source_names = [s.name for s in ALL_SCRAPERS]
+    source_names = [cls.name for cls in scraper_classes()]
     report = get_health_report(conn, source_names)
-    conn.close()
     print("\n" + report)
 
 
@@ -8,8 +8,12 @@
 各通道憑證未設定時靜默跳過。
 """
 
+import json
 import logging
+import time
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any
 
 import httpx
@@ -17,6 +21,7 @@ import httpx
 from .config import (
     LINE_CHANNEL_ID,
     LINE_CHANNEL_SECRET,
+    LINE_TOKEN_CACHE_PATH,
     LINE_USER_ID,
     SLACK_WEBHOOK_URL,
     TELEGRAM_BOT_TOKEN,
@@ -51,18 +56,14 @@ def send_notification(
         tracks, spotify_found, spotify_not_found, apple_music_status, unhealthy_sources
     )
 
-    _send_line(message)
-    _send_telegram(message)
-    _send_slack(message)
+    _broadcast(message)
 
 
 def send_no_new_tracks_notification() -> None:
     """發送「今日無新曲目」通知至所有已設定的通道。"""
     message = "🎵 Music Collector 執行完成\n\n今日無新曲目。"
 
-    _send_line(message)
-    _send_telegram(message)
-    _send_slack(message)
+    _broadcast(message)
 
 
 def send_apple_music_notification(
@@ -81,29 +82,87 @@ def send_apple_music_notification(
     """
     message = _build_apple_music_message(success, track_count, playlist_name, error)
 
-    _send_line(message)
-    _send_telegram(message)
-    _send_slack(message)
+    _broadcast(message)
+
+
+def _broadcast(message: str) -> None:
+    """同時發送訊息至 LINE / Telegram / Slack，總耗時約等於最慢的通道。
+
+    未設定憑證的通道會立即返回；任一通道的例外在所有通道完成後才拋出。
+    """
+    senders = (_send_line, _send_telegram, _send_slack)
+    with ThreadPoolExecutor(max_workers=len(senders)) as executor:
+        futures = [executor.submit(send, message) for send in senders]
+    for future in futures:
+        future.result()
+
+
+@lru_cache(maxsize=1)
+def _client() -> httpx.Client:
+    """所有通道共用的 HTTP 客戶端，以 keep-alive 重用連線（如 LINE Token 與推播同主機）。"""
+    return httpx.Client(
+        timeout=15,
+        limits=httpx.Limits(max_keepalive_connections=10),
+    )
 
 
 # ── LINE Messaging API ──
 
 
+# 快取 Token 在到期前預留的安全秒數
+LINE_TOKEN_EXPIRY_MARGIN = 60
+
+
+def _load_cached_line_token() -> str | None:
+    """讀取磁碟上的 LINE Token 快取；不存在、已過期或屬於其他 Channel 時回傳 None。"""
+    try:
+        data = json.loads(LINE_TOKEN_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if data.get("channel_id") != LINE_CHANNEL_ID:
+        return None
+    if data.get("expires_at", 0) <= time.time() + LINE_TOKEN_EXPIRY_MARGIN:
+        return None
+    return data.get("access_token")
+
+
+def _save_cached_line_token(token: str, expires_in: int) -> None:
+    """將 LINE Token 與到期時間寫入磁碟快取，寫入失敗僅記錄警告。"""
+    data = {
+        "channel_id": LINE_CHANNEL_ID,
+        "access_token": token,
+        "expires_at": time.time() + expires_in,
+    }
+    try:
+        LINE_TOKEN_CACHE_PATH.write_text(json.dumps(data), encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"LINE Token 快取寫入失敗：{e}")
+
+
 def _get_line_access_token() -> str | None:
-    """用 Channel ID + Secret 產生短期 Access Token。"""
-    resp = httpx.post(
+    """取得 LINE Access Token。
+
+    短期 Token 有效期約 30 天，優先使用磁碟快取，過期後才以
+    Channel ID + Secret 重新產生。
+    """
+    cached = _load_cached_line_token()
+    if cached:
+        return cached
+
+    resp = _client().post(
         LINE_TOKEN_URL,
         data={
             "grant_type": "client_credentials",
             "client_id": LINE_CHANNEL_ID,
             "client_secret": LINE_CHANNEL_SECRET,
         },
-        timeout=15,
     )
     if resp.status_code != 200:
         logger.warning(f"LINE Token 取得失敗：{resp.status_code} {resp.text}")
         return None
-    return resp.json()["access_token"]
+    body = resp.json()
+    _save_cached_line_token(body["access_token"], body.get("expires_in", 0))
+    return body["access_token"]
 
 
 def _send_line(message: str) -> None:
@@ -116,7 +175,7 @@ def _send_line(message: str) -> None:
     if not token:
         return
 
-    resp = httpx.post(
+    resp = _client().post(
         LINE_PUSH_URL,
         headers={
             "Content-Type": "application/json",
@@ -126,12 +185,14 @@ def _send_line(message: str) -> None:
             "to": LINE_USER_ID,
             "messages": [{"type": "text", "text": message}],
         },
-        timeout=15,
     )
 
     if resp.status_code == 200:
         logger.info("LINE 通知發送成功")
     else:
+        if resp.status_code == 401:
+            # Token 已被撤銷：清除快取，下次重新產生
+            LINE_TOKEN_CACHE_PATH.unlink(missing_ok=True)
         logger.warning(f"LINE 通知發送失敗：{resp.status_code} {resp.text}")
 
 
@@ -145,14 +206,13 @@ def _send_telegram(message: str) -> None:
         return
 
     url = TELEGRAM_API_URL.format(token=TELEGRAM_BOT_TOKEN)
-    resp = httpx.post(
+    resp = _client().post(
         url,
         json={
             "chat_id": TELEGRAM_CHAT_ID,
             "text": message,
             "parse_mode": "HTML",
         },
-        timeout=15,
     )
 
     if resp.status_code == 200:
@@ -170,10 +230,9 @@ def _send_slack(message: str) -> None:
         logger.debug("Slack Webhook 未設定，跳過通知。")
         return
 
-    resp = httpx.post(
+    resp = _client().post(
         SLACK_WEBHOOK_URL,
         json={"text": message},
-        timeout=15,
     )
 
     if resp.status_code == 200:
@@ -254,9 +313,7 @@ def _build_apple_music_message(
 def send_source_health_notification(unhealthy_sources: list[Any]) -> None:
     """發送來源健康警示至所有已設定的通道。"""
     message = _build_source_health_message(unhealthy_sources)
-    _send_line(message)
-    _send_telegram(message)
-    _send_slack(message)
+    _broadcast(message)
 
 
 def _build_source_health_message(unhealthy_sources: list[Any]) -> str:
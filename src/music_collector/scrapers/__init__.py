@@ -1,35 +1,53 @@
-"""擷取器註冊表：匯入所有擷取器並組成 ALL_SCRAPERS 清單。
+"""擷取器註冊表：列出所有擷取器的模組與類別名稱，需要時才匯入。
 
-主流程會依序執行 ALL_SCRAPERS 中的每個擷取器。
-新增擷取器時，在此匯入並加入清單即可。
+主流程透過 iter_scrapers() 取得擷取器實例，只需來源名稱時用 scraper_classes()
+（不建立實例）；不擷取的子命令（--recent、--backup、--export、--stats）
+不會載入 bs4 / feedparser 等依賴。
+新增擷取器時，在 _SCRAPER_SPECS 加入 (模組, 類別) 即可。
 """
 
-from .pitchfork import PitchforkScraper
-from .stereogum import StereogumScraper
-from .lineofbestfit import LineOfBestFitScraper
-from .consequence import ConsequenceScraper
-from .nme import NMEScraper
-from .spin import SpinScraper
-from .rollingstone import RollingStoneScraper
-from .slant import SlantScraper
-from .complex import ComplexScraper
-from .residentadvisor import ResidentAdvisorScraper
-from .gorillavsbear import GorillaVsBearScraper
-from .bandcamp import BandcampDailyScraper
-from .quietus import TheQuietusScraper
-
-ALL_SCRAPERS = [
-    PitchforkScraper(),         # Pitchfork — HTML 擷取
-    StereogumScraper(),         # Stereogum — RSS 擷取
-    LineOfBestFitScraper(),     # The Line of Best Fit — HTML 擷取
-    ConsequenceScraper(),       # Consequence of Sound — HTML 擷取
-    NMEScraper(),               # NME — HTML 擷取（二階段：索引頁 → 文章頁）
-    SpinScraper(),              # SPIN — HTML 擷取（月度精選）
-    RollingStoneScraper(),      # Rolling Stone — HTML 擷取（音樂新聞與特輯）
-    SlantScraper(),             # Slant Magazine — HTML 擷取（樂評標題）
-    ComplexScraper(),           # Complex — HTML 擷取（嘻哈/R&B 為主）
-    ResidentAdvisorScraper(),   # Resident Advisor — HTML 擷取（電子音樂，JS 渲染受限）
-    GorillaVsBearScraper(),     # Gorilla vs. Bear — RSS 擷取（獨立音樂）
-    BandcampDailyScraper(),     # Bandcamp Daily — RSS 擷取（Album of the Day）
-    TheQuietusScraper(),        # The Quietus — RSS 擷取（英國獨立/實驗音樂）
+from collections.abc import Iterator
+from functools import cache
+from importlib import import_module
+
+from .base import BaseScraper
+
+_SCRAPER_SPECS = [
+    (".pitchfork", "PitchforkScraper"),             # Pitchfork — HTML 擷取
+    (".stereogum", "StereogumScraper"),             # Stereogum — RSS 擷取
+    (".lineofbestfit", "LineOfBestFitScraper"),     # The Line of Best Fit — HTML 擷取
+    (".consequence", "ConsequenceScraper"),         # Consequence of Sound — HTML 擷取
+    (".nme", "NMEScraper"),                         # NME — HTML 擷取（二階段：索引頁 → 文章頁）
+    (".spin", "SpinScraper"),                       # SPIN — HTML 擷取（月度精選）
+    (".rollingstone", "RollingStoneScraper"),       # Rolling Stone — HTML 擷取（音樂新聞與特輯）
+    (".slant", "SlantScraper"),                     # Slant Magazine — HTML 擷取（樂評標題）
+    (".complex", "ComplexScraper"),                 # Complex — HTML 擷取（嘻哈/R&B 為主）
+    (".residentadvisor", "ResidentAdvisorScraper"), # Resident Advisor — HTML 擷取（電子音樂，JS 渲染受限）
+    (".gorillavsbear", "GorillaVsBearScraper"),     # Gorilla vs. Bear — RSS 擷取（獨立音樂）
+    (".bandcamp", "BandcampDailyScraper"),          # Bandcamp Daily — RSS 擷取（Album of the Day）
+    (".quietus", "TheQuietusScraper"),              # The Quietus — RSS 擷取（英國獨立/實驗音樂）
 ]
+
+
+@cache
+def scraper_classes() -> tuple[type[BaseScraper], ...]:
+    """依註冊順序匯入並回傳所有擷取器類別（首次呼叫時才匯入模組）。"""
+    return tuple(
+        getattr(import_module(module_name, __name__), class_name)
+        for module_name, class_name in _SCRAPER_SPECS
+    )
+
+
+def iter_scrapers() -> Iterator[BaseScraper]:
+    """依註冊順序建立各擷取器實例。"""
+    for cls in scraper_classes():
+        yield cls()
+
+
+def __getattr__(name: str):
+    """相容舊介面：首次存取 ALL_SCRAPERS 時才建立完整清單。"""
+    if name == "ALL_SCRAPERS":
+        scrapers = list(iter_scrapers())
+        globals()["ALL_SCRAPERS"] = scrapers
+        return scrapers
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
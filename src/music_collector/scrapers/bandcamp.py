@@ -11,31 +11,31 @@
 import logging
 import re
 
-import feedparser
-
 from .base import BaseScraper, Track
-from ..config import MAX_TRACKS_PER_SOURCE
 
 logger = logging.getLogger(__name__)
 
 FEED_URL = "https://daily.bandcamp.com/feed"
 
+# 「Artist, "Album Title"」：逗號分隔 + 引號包裹的專輯名
+_BANDCAMP_TITLE_RE = re.compile(r'^(.+?),\s*["\u201c\u2018\']+(.+?)["\u201d\u2019\']+')
+
 
 class BandcampDailyScraper(BaseScraper):
     name = "Bandcamp Daily"
 
     def fetch_tracks(self) -> list[Track]:
+        return self._fetch_feed_tracks(FEED_URL, self._parse_feed)
+
+    def _parse_feed(self, content: bytes) -> list[Track]:
         tracks: list[Track] = []
-        feed = feedparser.parse(FEED_URL)
+        items = self._feed_items(content)
 
-        if feed.bozo and not feed.entries:
+        if items is None:
             logger.warning("Bandcamp Daily RSS feed 解析失敗")
             return tracks
 
-        for entry in feed.entries[:MAX_TRACKS_PER_SOURCE]:
-            title_text = entry.get("title", "")
-            categories = [c.get("term", "").lower() for c in entry.get("tags", [])]
-
+        for title_text, categories in items:
             # 過濾「Album of the Day」與「Best of」等推薦類別
             is_recommendation = any(
                 kw in cat
@@ -68,10 +68,7 @@ class BandcampDailyScraper(BaseScraper):
           - 「Artist, 'Album Title'」
         """
         # 格式一：逗號分隔 + 引號包裹的專輯名
-        m = re.match(
-            r'^(.+?),\s*["\u201c\u2018\']+(.+?)["\u201d\u2019\']+',
-            text,
-        )
+        m = _BANDCAMP_TITLE_RE.match(text)
         if m:
             artist = m.group(1).strip()
             title = m.group(2).strip()
@@ -3,21 +3,62 @@
 所有擷取器必須繼承 BaseScraper 並實作 fetch_tracks() 方法。
 """
 
+import json
 import logging
 import re
+import threading
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import astuple, dataclass
+from functools import lru_cache
+from importlib.util import find_spec
+from io import BytesIO
+from pathlib import Path
 
 import httpx
+from lxml import etree
 
-from ..config import ENABLE_PLAYWRIGHT, REQUEST_TIMEOUT, USER_AGENT
+from ..config import (
+    ENABLE_PLAYWRIGHT,
+    FEED_CACHE_DIR,
+    MAX_TRACKS_PER_SOURCE,
+    REQUEST_TIMEOUT,
+    USER_AGENT,
+)
+from .dom import visible_text
 
 logger = logging.getLogger(__name__)
 
+_ARTIST_TITLE_SEPARATORS = (" – ", " - ", " — ", ": ")  # 依優先順序
+_QUOTES = "\"'\u2018\u2019\u201c\u201d"  # 直/彎引號
+_NON_WORD_RE = re.compile(r"[^\w'-]")  # 比對動詞前移除的標點
 
-@dataclass
+# Playwright 同步 API 的物件只能在建立它的執行緒使用，而擷取器在執行緒池中平行執行，
+# 因此所有渲染工作交由單一專屬執行緒處理，瀏覽器與 context 只在該執行緒啟動一次
+_render_lock = threading.Lock()
+_render_pool: ThreadPoolExecutor | None = None
+_browser = None  # (playwright, browser, context)；僅限渲染執行緒存取
+
+
+@lru_cache(maxsize=1)
+def _client() -> httpx.Client:
+    """所有擷取器共用的 HTTP 客戶端（執行緒安全）。
+
+    以 keep-alive 重用同主機的 TCP / TLS 連線（如 NME 索引頁 → 文章頁），
+    並只建立一次連線池與 SSL context。
+    """
+    return httpx.Client(
+        headers={"User-Agent": USER_AGENT},
+        timeout=REQUEST_TIMEOUT,
+        follow_redirects=True,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    )
+
+
+@dataclass(slots=True, frozen=True)
 class Track:
-    """曲目資料模型。"""
+    """曲目資料模型（不可變、無 __dict__，可作為 set / dict 的鍵）。"""
     artist: str   # 藝人名稱
     title: str    # 曲目名稱
     source: str   # 來源媒體名稱
@@ -43,13 +84,118 @@ class BaseScraper(ABC):
         """擷取曲目清單，回傳 Track 物件列表。"""
         ...
 
-    def _get(self, url: str) -> httpx.Response:
-        """發送 HTTP GET 請求，附帶 User-Agent 標頭與逾時設定。"""
-        headers = {"User-Agent": USER_AGENT}
-        resp = httpx.get(url, headers=headers, timeout=REQUEST_TIMEOUT, follow_redirects=True)
-        resp.raise_for_status()
+    def _get(self, url: str, headers: dict[str, str] | None = None) -> httpx.Response:
+        """以共用客戶端發送 HTTP GET 請求，附帶 User-Agent 標頭與逾時設定。
+
+        條件式請求的 304 Not Modified 直接回傳，由呼叫端處理。
+        """
+        resp = _client().get(url, headers=headers)
+        if resp.status_code != 304:
+            resp.raise_for_status()
         return resp
 
+    def _get_or_none(self, url: str) -> httpx.Response | None:
+        """下載頁面，失敗時回傳 None 以改試下一個 URL。"""
+        try:
+            return self._get(url)
+        except Exception as e:
+            logger.debug(f"{self.name}：無法取得 {url}：{e}")
+            return None
+
+    def _get_all(self, urls: list[str]) -> list[httpx.Response | None]:
+        """同時下載多個候選頁面，依輸入順序回傳，失敗者為 None。
+
+        耗時為最慢一頁而非逐頁累加；呼叫端仍可依順序逐一嘗試。
+        """
+        with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            return list(executor.map(self._get_or_none, urls))
+
+    def _feed_cache_path(self) -> Path:
+        """此擷取器的 RSS 快取檔路徑（以模組名稱命名，如 bandcamp.json）。"""
+        return FEED_CACHE_DIR / f"{type(self).__module__.rsplit('.', 1)[-1]}.json"
+
+    def _fetch_feed_tracks(self, url: str, parse: Callable[[bytes], list[Track]]) -> list[Track]:
+        """以條件式 GET 下載 RSS feed，未變動時直接回傳上次解析的曲目。
+
+        由 httpx 下載可沿用 User-Agent 與逾時設定，網路錯誤也會拋出例外，
+        讓健康檢查記錄為失敗而非空結果。快取檔記錄上次回應的
+        ETag / Last-Modified 與解析結果；伺服器回傳 304 時省去下載與
+        XML 解析。feed 有更新時以 parse(回應內容) 解析並覆寫快取。
+        快取損毀或無法寫入時視同無快取。
+        """
+        path = self._feed_cache_path()
+        try:
+            cache = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            cache = {}
+        if cache.get("url") != url:
+            cache = {}
+
+        headers = {}
+        if cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
+        if cache.get("modified"):
+            headers["If-Modified-Since"] = cache["modified"]
+
+        resp = self._get(url, headers)
+        if resp.status_code == 304 and cache:
+            logger.info(f"{self.name}：feed 未更新，沿用快取的 {len(cache['tracks'])} 首曲目")
+            return [Track(*t) for t in cache["tracks"]]
+
+        tracks = parse(resp.content)
+
+        etag = resp.headers.get("ETag")
+        modified = resp.headers.get("Last-Modified")
+        if etag or modified:
+            cache = {
+                "url": url,
+                "etag": etag,
+                "modified": modified,
+                "tracks": [astuple(t) for t in tracks],
+            }
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(json.dumps(cache, ensure_ascii=False), encoding="utf-8")
+            except OSError as e:
+                logger.debug(f"無法寫入 feed 快取 {path}：{e}")
+        return tracks
+
+    @staticmethod
+    def _feed_items(
+        content: bytes, limit: int = MAX_TRACKS_PER_SOURCE
+    ) -> list[tuple[str, list[str]]] | None:
+        """解析 RSS，回傳前 limit 個項目的（標題, 小寫分類清單）。
+
+        以 lxml iterparse 逐一讀取 <item>，只取 title 與 category 並隨即釋放節點，
+        讀滿 limit 個即停止，不建立 feedparser 的完整 entry 字典。
+        XML 格式錯誤或找不到 <item>（如 Atom feed）時改用 feedparser 容錯解析；
+        兩者皆無法解析時回傳 None。
+        """
+        from lxml import etree
+
+        items: list[tuple[str, list[str]]] = []
+        try:
+            for _, item in etree.iterparse(BytesIO(content), tag="item"):
+                categories = [c.text.lower() for c in item.iterfind("category") if c.text]
+                items.append((item.findtext("title") or "", categories))
+                item.clear()
+                if len(items) >= limit:
+                    break
+        except etree.XMLSyntaxError:
+            items = []
+        if items:
+            return items
+
+        import feedparser
+
+        feed = feedparser.parse(content)
+        if feed.bozo and not feed.entries:
+            return None
+        return [
+            (entry.get("title", ""), [c.get("term", "").lower() for c in entry.get("tags", [])])
+            for entry in feed.entries[:limit]
+        ]
+
     @staticmethod
     def parse_artist_title(text: str) -> tuple[str, str] | None:
         """解析「藝人 – 曲名」格式的文字。
@@ -57,11 +203,12 @@ class BaseScraper(ABC):
         支援的分隔符號：" – "、" - "、" — "、": "
         """
         text = text.strip()
-        for sep in [" – ", " - ", " — ", ": "]:
+        for sep in _ARTIST_TITLE_SEPARATORS:
             if sep in text:
-                parts = text.split(sep, 1)
-                artist = parts[0].strip().strip('"').strip("'")
-                title = parts[1].strip().strip('"').strip("'")
+                artist, _, title = text.partition(sep)
+                # 先去除所有 Unicode 空白，再去除外層引號（引號內的空白保留）
+                artist = artist.strip().strip(_QUOTES)
+                title = title.strip().strip(_QUOTES)
                 if artist and title:
                     return artist, title
         return None
@@ -71,53 +218,24 @@ class BaseScraper(ABC):
 
         需安裝 playwright 可選依賴（uv sync --extra browser）
         並設定 ENABLE_PLAYWRIGHT=true 環境變數。
+        瀏覽器於首次呼叫時啟動並供後續所有頁面共用，由 close_browser() 關閉。
         回傳 HTML 字串，或 None（Playwright 未安裝/未啟用/失敗時）。
         """
         if not ENABLE_PLAYWRIGHT:
             return None
 
-        try:
-            from playwright.sync_api import sync_playwright
-        except ImportError:
+        if find_spec("playwright") is None:
             logger.debug("Playwright 未安裝，跳過 JS 渲染。安裝：uv sync --extra browser")
             return None
 
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(
-                    headless=True,
-                    args=["--disable-blink-features=AutomationControlled"],
-                )
-                context = browser.new_context(
-                    user_agent=USER_AGENT,
-                    viewport={"width": 1280, "height": 720},
-                )
-                page = context.new_page()
-
-                # 隱藏 webdriver 特徵
-                page.add_init_script(
-                    "Object.defineProperty(navigator, 'webdriver', {get: () => false})"
-                )
-
-                page.goto(url, wait_until="domcontentloaded", timeout=30000)
-
-                try:
-                    page.wait_for_selector(wait_selector, timeout=10000)
-                except Exception:
-                    logger.debug(f"等待選擇器 {wait_selector} 逾時，繼續擷取")
-
-                # 等待網路靜止（React/Next.js hydration）
-                try:
-                    page.wait_for_load_state("networkidle", timeout=5000)
-                except Exception:
-                    pass
-
-                html = page.content()
-                page.close()
-                context.close()
-                browser.close()
-                return html
+        global _render_pool
+        with _render_lock:
+            if _render_pool is None:
+                _render_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="playwright")
+            pool = _render_pool
 
+        try:
+            return pool.submit(_render_page, url, wait_selector).result()
         except Exception as e:
             logger.warning(f"Playwright 渲染失敗 {url}：{e}")
             return None
@@ -128,24 +246,35 @@ class BaseScraper(ABC):
         lower = text.lower()
         return any(ind in lower for ind in BaseScraper._JS_BLOCK_INDICATORS)
 
+    @classmethod
+    def _looks_js_only(cls, tree: etree._Element, min_len: int) -> bool:
+        """可見文字不足 min_len 字或含 JS 挑戰標記時，視為需要瀏覽器渲染。"""
+        body_text = visible_text(tree)
+        return len(body_text) < min_len or cls._is_js_blocked(body_text)
+
     @staticmethod
-    def _extract_artist_before_verb(prefix: str, verb_pattern: re.Pattern[str]) -> str:
+    def _extract_artist_before_verb(
+        prefix: str, verbs: frozenset[str], ignore_case: bool = True
+    ) -> str:
         """從標題前綴中提取藝人名，遇到第一個動詞即截斷。
 
-        逐字掃描 prefix（跳過第一個字），遇到符合 verb_pattern 的單字時，
+        逐字掃描 prefix（跳過第一個字），去除標點後的單字若在 verbs 中，
         取該字之前的所有文字作為藝人名。
 
         Args:
             prefix: 標題中引號前的文字。
-            verb_pattern: 已編譯的動詞正規表達式（用於 fullmatch）。
+            verbs: 動詞集合（ignore_case 時須為小寫）。
+            ignore_case: 是否先將單字轉小寫再查詢。
         """
         words = prefix.split()
         if not words:
             return prefix
 
         for i in range(1, len(words)):
-            clean_word = re.sub(r"[^\w'-]", "", words[i])
-            if verb_pattern.fullmatch(clean_word):
+            clean_word = _NON_WORD_RE.sub("", words[i])
+            if ignore_case:
+                clean_word = clean_word.lower()
+            if clean_word in verbs:
                 candidate = " ".join(words[:i]).strip()
                 if candidate:
                     return candidate
@@ -166,6 +295,79 @@ class BaseScraper(ABC):
 
     @staticmethod
     def clean_text(text: str) -> str:
-        """清理文字：移除多餘空白、HTML 實體等。"""
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
+        """清理文字：將連續空白（含 Unicode 空白）合併為單一空格並去除頭尾空白。"""
+        return " ".join(text.split())
+
+
+def _render_page(url: str, wait_selector: str) -> str:
+    """在渲染執行緒上開新分頁載入 url，回傳渲染後的 HTML。"""
+    global _browser
+    if _browser is None:
+        from playwright.sync_api import sync_playwright
+
+        playwright = sync_playwright().start()
+        try:
+            browser = playwright.chromium.launch(
+                headless=True,
+                args=["--disable-blink-features=AutomationControlled"],
+            )
+            context = browser.new_context(
+                user_agent=USER_AGENT,
+                viewport={"width": 1280, "height": 720},
+            )
+            # 隱藏 webdriver 特徵
+            context.add_init_script(
+                "Object.defineProperty(navigator, 'webdriver', {get: () => false})"
+            )
+        except Exception:
+            playwright.stop()
+            raise
+        _browser = (playwright, browser, context)
+
+    page = _browser[2].new_page()
+    try:
+        page.goto(url, wait_until="domcontentloaded", timeout=30000)
+
+        try:
+            page.wait_for_selector(wait_selector, timeout=10000)
+        except Exception:
+            logger.debug(f"等待選擇器 {wait_selector} 逾時，繼續擷取")
+
+        # 等待網路靜止（React/Next.js hydration）
+        try:
+            page.wait_for_load_state("networkidle", timeout=5000)
+        except Exception:
+            pass
+
+        return page.content()
+    finally:
+        page.close()
+
+
+def _shutdown_browser() -> None:
+    """在渲染執行緒上關閉共用的 context、瀏覽器與 Playwright。"""
+    global _browser
+    if _browser is None:
+        return
+    playwright, browser, context = _browser
+    _browser = None
+    try:
+        context.close()
+        browser.close()
+    finally:
+        playwright.stop()
+
+
+def close_browser() -> None:
+    """關閉共用的 Playwright 瀏覽器與渲染執行緒（未啟動過則不做任何事）。"""
+    global _render_pool
+    with _render_lock:
+        pool, _render_pool = _render_pool, None
+    if pool is None:
+        return
+    try:
+        pool.submit(_shutdown_browser).result()
+    except Exception as e:
+        logger.warning(f"關閉 Playwright 瀏覽器失敗：{e}", exc_info=True)
+    finally:
+        pool.shutdown()
@@ -9,9 +9,10 @@
 import logging
 import re
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from .base import BaseScraper, Track
+from .dom import node_text, parse_html
 from ..config import MAX_TRACKS_PER_SOURCE
 
 logger = logging.getLogger(__name__)
@@ -22,6 +23,31 @@ URLS = [
     "https://www.complex.com/tag/best-new-music",
 ]
 
+# 標題常見前綴，預先計算小寫與長度：(小寫前綴, 長度)
+_PREFIXES = tuple(
+    (p.lower(), len(p))
+    for p in [
+        "Best New Music This Week:",
+        "Best New Music:",
+        "New Music:",
+        "Premiere:",
+        "Stream:",
+        "Listen:",
+    ]
+)
+_PREFIX_STARTS = tuple(p for p, _ in _PREFIXES)  # 供 str.startswith 一次比對所有前綴
+
+# 標題連結，等同 CSS 選擇器「h2 a, h3 a, article a, .post-title a」（依文件順序、不重複）
+_HEADING_LINKS = etree.XPath(
+    "//h2//a | //h3//a | //article//a"
+    " | //*[contains(concat(' ', normalize-space(@class), ' '), ' post-title ')]//a"
+)
+# 可見文字少於此字數時視為 JS 渲染空殼頁
+_MIN_VISIBLE_CHARS = 200
+
+# 引號包裹的曲名
+_QUOTED_TITLE_RE = re.compile(r"['\u2018\u201c\"]+(.+?)['\u2019\u201d\"]+")
+
 
 class ComplexScraper(BaseScraper):
     name = "Complex"
@@ -29,27 +55,24 @@ class ComplexScraper(BaseScraper):
     def fetch_tracks(self) -> list[Track]:
         tracks: list[Track] = []
 
-        for url in URLS:
-            try:
-                resp = self._get(url)
-            except Exception:
+        # 同時下載所有候選頁面；仍依 URLS 順序處理
+        for url, resp in zip(URLS, self._get_all(URLS)):
+            if resp is None:
                 continue
 
-            soup = BeautifulSoup(resp.text, "lxml")
+            # 直接以 lxml 解析並用預先編譯的 XPath 查詢，省去 BeautifulSoup 包裝每個節點的成本
+            tree = parse_html(resp.text)
 
-            # 偵測 JS 渲染：如果頁面內容極少、含 JS 挑戰標記、或缺少文章連結
-            body_text = soup.get_text(strip=True)
-            content_selectors = soup.select("h2 a, h3 a, article a, .post-title a")
-            needs_js = (
-                len(body_text) < 200
-                or self._is_js_blocked(body_text)
-                or not content_selectors
-            )
+            # 偵測 JS 渲染：缺少文章連結、頁面內容極少、或含 JS 挑戰標記；
+            # 先做成本最低的連結檢查，有連結時才組出可見文字
+            links = _HEADING_LINKS(tree) if tree is not None else []
+            needs_js = not links or self._looks_js_only(tree, _MIN_VISIBLE_CHARS)
             if needs_js:
                 # 嘗試 Playwright fallback
                 html = self._get_rendered(url, wait_selector="article, .music, h2")
-                if html:
-                    soup = BeautifulSoup(html, "lxml")
+                tree = parse_html(html) if html else None
+                if tree is not None:
+                    links = _HEADING_LINKS(tree)
                     logger.info("Complex：透過 Playwright 成功取得渲染頁面")
                 else:
                     logger.warning(
@@ -58,41 +81,40 @@ class ComplexScraper(BaseScraper):
                     )
                     continue
 
-            for heading in soup.select("h2 a, h3 a, article a, .post-title a")[
-                :MAX_TRACKS_PER_SOURCE
-            ]:
-                text = self.clean_text(heading.get_text())
-                if not text or len(text) < 5:
+            # 迴圈內使用的方法先綁定為區域變數，省去每個標題的屬性查找
+            clean = self.clean_text
+            search_quoted = _QUOTED_TITLE_RE.search
+            parse = self.parse_artist_title
+            append = tracks.append
+            source = self.name
+
+            for heading in links[:MAX_TRACKS_PER_SOURCE]:
+                text = clean(node_text(heading))
+                if len(text) < 5:
                     continue
 
-                # 移除常見前綴
-                for prefix in [
-                    "Best New Music This Week:",
-                    "Best New Music:",
-                    "New Music:",
-                    "Premiere:",
-                    "Stream:",
-                    "Listen:",
-                ]:
-                    if text.lower().startswith(prefix.lower()):
-                        text = text[len(prefix) :].strip()
+                # 移除常見前綴（小寫只在文字變動時重算）
+                lower = text.lower()
+                if lower.startswith(_PREFIX_STARTS):
+                    for prefix_lower, prefix_len in _PREFIXES:
+                        if lower.startswith(prefix_lower):
+                            text = text[prefix_len:].strip()
+                            lower = text.lower()
 
                 # 嘗試從引號中提取曲名
-                m = re.search(r"['\u2018\u201c\"]+(.+?)['\u2019\u201d\"]+", text)
+                m = search_quoted(text)
                 if m:
                     title = m.group(1).strip()
                     artist = text[: m.start()].strip().rstrip("'s").rstrip(",").strip()
                     if artist and title:
-                        tracks.append(
-                            Track(artist=artist, title=title, source=self.name)
-                        )
+                        append(Track(artist=artist, title=title, source=source))
                         continue
 
                 # 備選：標準「Artist – Title」格式
-                parsed = self.parse_artist_title(text)
+                parsed = parse(text)
                 if parsed:
                     artist, title = parsed
-                    tracks.append(Track(artist=artist, title=title, source=self.name))
+                    append(Track(artist=artist, title=title, source=source))
 
             if tracks:
                 break
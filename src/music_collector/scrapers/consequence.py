@@ -10,10 +10,12 @@
 
 import logging
 import re
+from functools import lru_cache
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from .base import BaseScraper, Track
+from .dom import node_text, parse_html
 from ..config import MAX_TRACKS_PER_SOURCE
 
 logger = logging.getLogger(__name__)
@@ -21,6 +23,16 @@ logger = logging.getLogger(__name__)
 # WordPress 分類頁面
 URL = "https://consequence.net/category/cos-exclusive-features/top-song-of-the-week/"
 
+# 文章標題連結，等同 CSS 選擇器「h2 a, h3 a」（依文件順序、不重複）
+_HEADING_LINKS = etree.XPath("//h2//a | //h3//a")
+
+# 引號包裹的曲名
+# 注意：不能將直引號 ' 放入字元集，否則所有格的 ' 會被誤判為開引號
+# 支援：" "（直雙引號）、\u201c \u201d（彎雙引號）、\u2018 \u2019（彎單引號）
+_QUOTED_TITLE_RE = re.compile(r'["\u201c\u201d\u2018\u2019]+(.+?)["\u201c\u201d\u2018\u2019]+')
+# 藝人名末尾的所有格 's 或 '
+_POSSESSIVE_SUFFIX_RE = re.compile(r"['\u2019]s?\s*$")
+
 
 class ConsequenceScraper(BaseScraper):
     name = "Consequence"
@@ -28,12 +40,13 @@ class ConsequenceScraper(BaseScraper):
     def fetch_tracks(self) -> list[Track]:
         tracks: list[Track] = []
         resp = self._get(URL)
-        soup = BeautifulSoup(resp.text, "lxml")
+        tree = parse_html(resp.text)
+        links = _HEADING_LINKS(tree) if tree is not None else []
 
         # WordPress 分類彙整頁：標題在 h2>a 或 h3>a 中
         # 只擷取主要內容區的文章標題，避免側邊欄和影片區塊
-        for heading in soup.select("h2 a, h3 a")[:MAX_TRACKS_PER_SOURCE]:
-            text = self.clean_text(heading.get_text())
+        for heading in links[:MAX_TRACKS_PER_SOURCE]:
+            text = self.clean_text(node_text(heading))
 
             # 只處理包含 "Song of the Week" 的標題
             if "song of the week" not in text.lower():
@@ -48,6 +61,7 @@ class ConsequenceScraper(BaseScraper):
         return tracks
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _parse_consequence_title(text: str) -> tuple[str, str] | None:
         """解析 Consequence 文章標題，提取藝人與曲名。
 
@@ -79,60 +93,57 @@ class ConsequenceScraper(BaseScraper):
             return None
 
         # 移除前綴（如 "Heavy Song of the Week:"）
-        colon_idx = text.find(":")
-        if colon_idx != -1:
-            text = text[colon_idx + 1 :].strip()
+        _, colon, rest = text.partition(":")
+        if colon:
+            text = rest.strip()
 
         # 嘗試從引號中提取曲名
-        # 注意：不能將直引號 ' 放入字元集，否則所有格的 ' 會被誤判為開引號
-        # 支援：" "（直雙引號）、\u201c \u201d（彎雙引號）、\u2018 \u2019（彎單引號）
-        m = re.search(
-            r'["\u201c\u201d\u2018\u2019]+(.+?)["\u201c\u201d\u2018\u2019]+', text
-        )
+        m = _QUOTED_TITLE_RE.search(text)
         if m:
             title = m.group(1).strip()
             prefix = text[: m.start()].strip()
 
             # 從 prefix 中去除動詞片語，只保留藝人名
-            artist = BaseScraper._extract_artist_before_verb(prefix, _VERB_PATTERNS)
+            artist = BaseScraper._extract_artist_before_verb(prefix, _VERBS)
 
             # 移除藝人名末尾的所有格 's 或 '
-            artist = re.sub(r"['\u2019]s?\s*$", "", artist).strip()
+            artist = _POSSESSIVE_SUFFIX_RE.sub("", artist).strip()
 
             if artist and title:
                 return artist, title
 
         # 備選：「Artist – Title」格式
-        for sep in [" – ", " - ", " — "]:
-            if sep in text:
-                parts = text.split(sep, 1)
-                return parts[0].strip(), parts[1].strip()
+        for sep in (" – ", " - ", " — "):
+            artist, found, title = text.partition(sep)
+            if found:
+                return artist.strip(), title.strip()
 
         return None
 
 
-# 常見動詞模式：用於辨識藝人名結束、描述文字開始的位置
-_VERB_PATTERNS = re.compile(
-    r"\b(?:"
+# 常見動詞集合（小寫）：用於辨識藝人名結束、描述文字開始的位置
+_VERBS = frozenset({
     # 常見的動作動詞（第三人稱、複數、原形）
-    r"Go(?:es)?|Bring(?:s)?|Take(?:s)?|Make(?:s)?|Lock(?:s)?|Mark(?:s)?|"
-    r"Drop(?:s)?|Return(?:s)?|Release(?:s)?|Deliver(?:s)?|Share(?:s)?|"
-    r"Unveil(?:s)?|Debut(?:s)?|Announce(?:s)?|Explore(?:s)?|Channel(?:s)?|"
-    r"Capture(?:s)?|Embrace(?:s)?|Find(?:s)?|Reveal(?:s)?|Offer(?:s)?|"
-    r"Open(?:s)?|Close(?:s)?|Play(?:s)?|Feel(?:s)?|Move(?:s)?|Give(?:s)?|"
-    r"Continue(?:s)?|Celebrate(?:s)?|Launch(?:es)?|Showcase(?:s)?|"
-    r"Premiere(?:s)?|Introduce(?:s)?|Present(?:s)?|Tackle(?:s)?|"
-    r"Unleash(?:es)?|Confront(?:s)?|Navigate(?:s)?|Demand(?:s)?|"
-    r"Paint(?:s)?|Steer(?:s)?|Wade(?:s)?|Resurrect(?:s)?|Sharpen(?:s)?|"
-    r"Soar(?:s)?|Dive(?:s)?|Wrestle(?:s)?|Wage(?:s)?|Salute(?:s)?|"
-    r"Tap(?:s)?|Hit(?:s)?|Get(?:s)?|Put(?:s)?|Set(?:s)?|Cut(?:s)?|"
-    r"Team(?:s)?|Join(?:s)?|Lead(?:s)?|Ride(?:s)?|Rise(?:s)?|Talk(?:s)?|"
-    r"Shred(?:s)?|Doom(?:s)?|Crush(?:es)?|Blast(?:s)?|Rage(?:s)?|Burn(?:s)?|"
+    "go", "goes", "bring", "brings", "take", "takes", "make", "makes", "lock", "locks",
+    "mark", "marks", "drop", "drops", "return", "returns", "release", "releases",
+    "deliver", "delivers", "share", "shares", "unveil", "unveils", "debut", "debuts",
+    "announce", "announces", "explore", "explores", "channel", "channels", "capture",
+    "captures", "embrace", "embraces", "find", "finds", "reveal", "reveals", "offer",
+    "offers", "open", "opens", "close", "closes", "play", "plays", "feel", "feels",
+    "move", "moves", "give", "gives", "continue", "continues", "celebrate",
+    "celebrates", "launch", "launches", "showcase", "showcases", "premiere",
+    "premieres", "introduce", "introduces", "present", "presents", "tackle", "tackles",
+    "unleash", "unleashes", "confront", "confronts", "navigate", "navigates", "demand",
+    "demands", "paint", "paints", "steer", "steers", "wade", "wades", "resurrect",
+    "resurrects", "sharpen", "sharpens", "soar", "soars", "dive", "dives", "wrestle",
+    "wrestles", "wage", "wages", "salute", "salutes", "tap", "taps", "hit", "hits",
+    "get", "gets", "put", "puts", "set", "sets", "cut", "cuts", "team", "teams", "join",
+    "joins", "lead", "leads", "ride", "rides", "rise", "rises", "talk", "talks",
+    "shred", "shreds", "doom", "dooms", "crush", "crushes", "blast", "blasts", "rage",
+    "rages", "burn", "burns",
     # 動詞描述短語的起始字
-    r"Is|Are|Has|Have|Had|Was|Were|Will|Would|Can|Could|"
+    "is", "are", "has", "have", "had", "was", "were", "will", "would", "can", "could",
     # 所有格名詞後常接的描述性名詞短語
-    r"Punk-Rock|Alt-Metal|Hard-Hitting|Full-Intensity|"
-    r"New|Latest|Signature|Artistic|Triumphant"
-    r")\b",
-    re.IGNORECASE,
-)
+    "punk-rock", "alt-metal", "hard-hitting", "full-intensity", "new", "latest",
+    "signature", "artistic", "triumphant",
+})
@@ -0,0 +1,33 @@
+"""HTML 解析工具：以 lxml 直接解析頁面，供以預先編譯 XPath 擷取的擷取器共用。
+
+相較於 BeautifulSoup + soupsieve，lxml 的 XPath 在 C 層完成比對，
+不需為每個節點建立 Tag 包裝物件。
+"""
+
+from lxml import etree
+from lxml import html as lxml_html
+
+# 頁面可見文字節點，排除 script / style / template（與 BeautifulSoup get_text() 一致）
+_VISIBLE_TEXT = etree.XPath(
+    "//text()[not(ancestor::script or ancestor::style or ancestor::template)]"
+)
+
+
+def parse_html(text: str) -> lxml_html.HtmlElement | None:
+    """解析 HTML 字串，空文件或無法解析時回傳 None。"""
+    try:
+        return lxml_html.document_fromstring(text)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def node_text(el: lxml_html.HtmlElement) -> str:
+    """回傳節點的文字內容；無子節點時直接取 .text，省去 text_content() 的 XPath 求值。"""
+    if len(el):
+        return el.text_content()
+    return el.text or ""
+
+
+def visible_text(tree: etree._Element) -> str:
+    """回傳頁面可見文字（各文字節點去除前後空白後串接），用於 JS 渲染偵測。"""
+    return "".join(t.strip() for t in _VISIBLE_TEXT(tree))
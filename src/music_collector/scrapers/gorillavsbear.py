@@ -7,38 +7,34 @@
 
 import logging
 
-import feedparser
-
 from .base import BaseScraper, Track
-from ..config import MAX_TRACKS_PER_SOURCE
 
 logger = logging.getLogger(__name__)
 
 FEED_URL = "https://gorillavsbear.net/feed/"
 
+# 音樂推薦相關分類關鍵字
+_MUSIC_KEYWORDS = ("mp3", "video", "on-blast", "music", "track", "single")
+
 
 class GorillaVsBearScraper(BaseScraper):
     name = "Gorilla vs. Bear"
 
     def fetch_tracks(self) -> list[Track]:
+        return self._fetch_feed_tracks(FEED_URL, self._parse_feed)
+
+    def _parse_feed(self, content: bytes) -> list[Track]:
         tracks: list[Track] = []
-        feed = feedparser.parse(FEED_URL)
+        items = self._feed_items(content)
 
-        if feed.bozo and not feed.entries:
+        if items is None:
             logger.warning("Gorilla vs. Bear RSS feed 解析失敗")
             return tracks
 
-        for entry in feed.entries[:MAX_TRACKS_PER_SOURCE]:
-            title_text = entry.get("title", "")
-            categories = [c.get("term", "").lower() for c in entry.get("tags", [])]
-
-            # 過濾音樂推薦相關分類
-            is_music = any(
-                kw in cat
-                for cat in categories
-                for kw in ["mp3", "video", "on-blast", "music", "track", "single"]
-            )
-            if not is_music:
+        for title_text, categories in items:
+            # 過濾音樂推薦相關分類（關鍵字皆不含空白，合併後比對不會跨分類誤判）
+            joined = " ".join(categories)
+            if not any(kw in joined for kw in _MUSIC_KEYWORDS):
                 continue
 
             # Gorilla vs. Bear 標題通常為「Artist – Title」格式
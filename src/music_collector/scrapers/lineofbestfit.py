@@ -9,10 +9,12 @@
 
 import logging
 import re
+from functools import lru_cache
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from .base import BaseScraper, Track
+from .dom import node_text, parse_html
 from ..config import MAX_TRACKS_PER_SOURCE
 
 logger = logging.getLogger(__name__)
@@ -20,6 +22,28 @@ logger = logging.getLogger(__name__)
 # /new-music/song-of-the-day 會重新導向至 /tracks
 URL = "https://www.thelineofbestfit.com/tracks"
 
+# 指向 /tracks/ 的文章連結，等同 CSS 選擇器「a[href*='/tracks/']」
+_TRACK_LINKS = etree.XPath("//a[contains(@href, '/tracks/')]")
+
+# 標題末尾引號包裹的曲名
+_QUOTE_CHARS = ("'", "\u2018", "\u2019", "\u201c", "\u201d", '"')
+_QUOTED_TITLE_RE = re.compile(
+    r"['\u2018\u2019\u201c\u201d\"]+(.+?)['\u2018\u2019\u201c\u201d\"]+\s*$"
+)
+# 所有格 's 之前的藝人名
+_POSSESSIVE_RE = re.compile(r"^(.+?)['\u2019]s\s+")
+# 大寫字開頭的藝人名，遇到小寫字（動詞）即停止；允許的小寫連接詞：
+# and, &, the, of, de, von, van, feat, ft, x, vs
+# 單字內以佔有量詞 *+ 一次吃完整段，避免同一段大寫字被拆成多個單字的
+# 指數級回溯（如一長串大寫字後不接小寫字時）；拆分不會產生不同的比對結果
+_ARTIST_CAPS_RE = re.compile(
+    r"^("
+    r"(?:[A-Z0-9\u00C0-\u024F][\w.\u00C0-\u024F-]*+"
+    r"(?:\s+(?:and|&|the|of|de|von|van|feat\.?|ft\.?|x|vs\.?)\s+)?)"
+    r"+)"
+    r"(?:\s+[a-z])"
+)
+
 
 class LineOfBestFitScraper(BaseScraper):
     name = "The Line of Best Fit"
@@ -27,24 +51,27 @@ class LineOfBestFitScraper(BaseScraper):
     def fetch_tracks(self) -> list[Track]:
         tracks: list[Track] = []
         resp = self._get(URL)
-        soup = BeautifulSoup(resp.text, "lxml")
+        tree = parse_html(resp.text)
+        links = _TRACK_LINKS(tree) if tree is not None else []
 
         # 擷取所有指向 /tracks/ 的文章連結
-        for link in soup.select("a[href*='/tracks/']")[:MAX_TRACKS_PER_SOURCE]:
-            text = self.clean_text(link.get_text())
-            if not text or len(text) < 10:
+        for link in links[:MAX_TRACKS_PER_SOURCE]:
+            text = self.clean_text(node_text(link))
+            if len(text) < 10:
                 continue
 
             parsed = self._parse_lobf_title(text)
-            if parsed:
-                artist, title = parsed
-                tracks.append(Track(artist=artist, title=title, source=self.name))
+            if not parsed:
+                continue
+            artist, title = parsed
+            tracks.append(Track(artist=artist, title=title, source=self.name))
 
         unique = self._deduplicate_tracks(tracks)
         logger.info(f"Line of Best Fit：找到 {len(unique)} 首曲目")
         return unique
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _parse_lobf_title(text: str) -> tuple[str, str] | None:
         """解析 LOBF 文章標題，提取藝人與曲名。
 
@@ -56,11 +83,12 @@ class LineOfBestFitScraper(BaseScraper):
           2. 正規表達式匹配：藝人名為大寫/首字大寫，第一個全小寫動詞之前的部分
           3. 動詞清單匹配：用擴充的動詞清單作為備選
         """
+        # 快速排除：曲名必在末尾引號中，結尾不是引號的標題（多為導覽連結）不必跑 regex
+        if not text.rstrip().endswith(_QUOTE_CHARS):
+            return None
+
         # 從末尾的引號中提取曲名
-        m = re.search(
-            r"['\u2018\u2019\u201c\u201d\"]+(.+?)['\u2018\u2019\u201c\u201d\"]+\s*$",
-            text,
-        )
+        m = _QUOTED_TITLE_RE.search(text)
         if not m:
             return None
         title = m.group(1).strip()
@@ -69,29 +97,21 @@ class LineOfBestFitScraper(BaseScraper):
 
         # === 策略 1：處理所有格 's ===
         # "Charlie Le Mindu's musical project MUCHAS PROBLEMAS..." → "Charlie Le Mindu"
-        possessive_m = re.match(r"^(.+?)['\u2019]s\s+", prefix)
+        possessive_m = _POSSESSIVE_RE.match(prefix)
         if possessive_m:
             artist = possessive_m.group(1).strip()
             if artist:
                 return artist, title
 
         # === 策略 2：正規表達式 — 大寫字開頭，遇到小寫字（動詞）即停止 ===
-        # 允許的小寫連接詞：and, &, the, of, de, von, van, feat, ft, x, vs
-        artist_m = re.match(
-            r"^("
-            r"(?:[A-Z0-9\u00C0-\u024F][\w.\u00C0-\u024F-]*"
-            r"(?:\s+(?:and|&|the|of|de|von|van|feat\.?|ft\.?|x|vs\.?)\s+)?)"
-            r"+)"
-            r"(?:\s+[a-z])",
-            prefix,
-        )
+        artist_m = _ARTIST_CAPS_RE.match(prefix)
         if artist_m:
             artist = artist_m.group(1).strip()
             if artist:
                 return artist, title
 
-        # === 策略 3：動詞 regex 切分 ===
-        artist = BaseScraper._extract_artist_before_verb(prefix, _VERB_RE)
+        # === 策略 3：動詞清單切分 ===
+        artist = BaseScraper._extract_artist_before_verb(prefix, _VERBS)
         artist = artist.strip().strip(",").strip()
         if artist and title:
             return artist, title
@@ -99,23 +119,26 @@ class LineOfBestFitScraper(BaseScraper):
         return None
 
 
-# 動詞模式：用於辨識藝人名結束、描述文字開始的位置
-_VERB_RE = re.compile(
-    r"\b(?:"
-    r"shares?|unveils?|releases?|announces?|debuts?|delivers?|drops?|"
-    r"returns?|confronts?|explores?|channels?|captures?|embraces?|"
-    r"numbs?|skewers?|soars?|dives?|finds?|reveals?|offers?|"
-    r"brings?|opens?|closes?|paints?|wrestles?|navigates?|"
-    r"plays?|feels?|demands?|draws?|moves?|gives?|longs?|"
-    r"marries|marry|steers?|wades?|resurrects?|sharpens?|"
-    r"does|do|is|are|has|have|gets?|freezes?|"
-    r"takes?|makes?|goes|go|comes?|puts?|sets?|"
-    r"rides?|rises?|leads?|hits?|cuts?|runs?|turns?|"
-    r"keeps?|holds?|stands?|tells?|calls?|shows?|"
-    r"wants?|needs?|looks?|creates?|builds?|picks?|"
-    r"teams?|joins?|taps?|imagines?|weaves?|traces?|"
-    r"balances?|blends?|crafts?|evokes?|reflects?|"
-    r"searches|search|pours?|digs?|strips?|transforms?|breaks?"
-    r")\b",
-    re.IGNORECASE,
-)
+# 動詞集合（小寫）：用於辨識藝人名結束、描述文字開始的位置
+_VERBS = frozenset({
+    "share", "shares", "unveil", "unveils", "release", "releases", "announce",
+    "announces", "debut", "debuts", "deliver", "delivers", "drop", "drops", "return",
+    "returns", "confront", "confronts", "explore", "explores", "channel", "channels",
+    "capture", "captures", "embrace", "embraces", "numb", "numbs", "skewer", "skewers",
+    "soar", "soars", "dive", "dives", "find", "finds", "reveal", "reveals", "offer",
+    "offers", "bring", "brings", "open", "opens", "close", "closes", "paint", "paints",
+    "wrestle", "wrestles", "navigate", "navigates", "play", "plays", "feel", "feels",
+    "demand", "demands", "draw", "draws", "move", "moves", "give", "gives", "long",
+    "longs", "marries", "marry", "steer", "steers", "wade", "wades", "resurrect",
+    "resurrects", "sharpen", "sharpens", "does", "do", "is", "are", "has", "have",
+    "get", "gets", "freeze", "freezes", "take", "takes", "make", "makes", "goes", "go",
+    "come", "comes", "put", "puts", "set", "sets", "ride", "rides", "rise", "rises",
+    "lead", "leads", "hit", "hits", "cut", "cuts", "run", "runs", "turn", "turns",
+    "keep", "keeps", "hold", "holds", "stand", "stands", "tell", "tells", "call",
+    "calls", "show", "shows", "want", "wants", "need", "needs", "look", "looks",
+    "create", "creates", "build", "builds", "pick", "picks", "team", "teams", "join",
+    "joins", "tap", "taps", "imagine", "imagines", "weave", "weaves", "trace", "traces",
+    "balance", "balances", "blend", "blends", "craft", "crafts", "evoke", "evokes",
+    "reflect", "reflects", "searches", "search", "pour", "pours", "dig", "digs",
+    "strip", "strips", "transform", "transforms", "break", "breaks",
+})
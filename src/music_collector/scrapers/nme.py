@@ -10,10 +10,12 @@
 
 import logging
 import re
+from functools import lru_cache
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from .base import BaseScraper, Track
+from .dom import node_text, parse_html
 from ..config import MAX_TRACKS_PER_SOURCE
 
 logger = logging.getLogger(__name__)
@@ -21,6 +23,48 @@ logger = logging.getLogger(__name__)
 # NME 曲目評論分類頁
 URL = "https://www.nme.com/reviews/track"
 
+# 評論標題連結，等同 CSS 選擇器「.entry-title a」
+# （原選擇器中的 h3.entry-title a、.td_module_wrap .entry-title a 皆為其子集）
+_HEADING_LINKS = etree.XPath(
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' entry-title ')]//a"
+)
+
+# 非曲目內容（訪談、訃聞、突襲發行新聞等）
+_SKIP_RE = re.compile(r"interview|obituary|surprise|release is")
+# 彎引號包裹的曲名：U+2018...U+2019 或 U+201C...U+201D
+_QUOTE_RE = re.compile(r"[\u2018\u201c](.+?)(?:\u2019(?![a-zA-Z])|\u201d)")
+# 曲名中的 "review" 後綴
+_REVIEW_SUFFIX_RE = re.compile(r"\s*(?:review|single review|track review).*$", re.IGNORECASE)
+# prefix 尾部的「Artist –」破折號
+_DASH_TAIL_RE = re.compile(r"\s*[–—-]\s*$")
+# prefix 尾部的 filler 詞（如 "'s new single"、"'s new winter single"、"'s new EP"，
+# 不分大小寫）與其前的所有格 's 或 '（區分大小寫），一次比對移除；
+# 結果等同先移除 filler 詞、再移除尾部所有格
+_PREFIX_TAIL_RE = re.compile(
+    r"(?:['\u2019]s?\s*)?"
+    r"(?i:['\u2019]s?\s+(?:new\s+)?(?:winter\s+|debut\s+|latest\s+)?"
+    r"(?:single|EP|album|track|song|record|release))?\s*$"
+)
+# 「Artist – Title」格式的曲名：開頭引號、"review" 後綴（連同其前的結尾引號）、結尾引號，
+# 一次比對移除；結果等同先移除 "review" 後綴、再移除前後引號
+_DASH_TITLE_CLEAN_RE = re.compile(
+    r"^[\u2018\u201c'\"]+"
+    r"|[\u2019\u201d'\"]*\s*(?i:review|single review|track review).*$"
+    r"|[\u2019\u201d'\"]+$"
+)
+# suffix 開頭的逗號和空白
+_LEADING_COMMA_RE = re.compile(r"^[,\s]+")
+# 「for Artist」與其後的描述
+_FOR_RE = re.compile(r"\bfor\s+(.+?)(?:\s*[?!.]|\s*$)")
+_QUESTION_TAIL_RE = re.compile(r"\?\s+.*$")
+# 「by Artist」
+_BY_RE = re.compile(r"\bby\s+(.+?)(?:\s*[-–—:?!.]|\s*$)")
+# 逗號後的第一組大寫字（如 ", Wolf Alice are..."）
+_COMMA_NAME_RE = re.compile(
+    r"^([A-Z][\w]*(?:\s+(?:and|&|the|of|The)\s+[A-Z][\w]*|"
+    r"\s+[A-Z][\w]*)*)"
+)
+
 
 class NMEScraper(BaseScraper):
     name = "NME"
@@ -34,13 +78,12 @@ class NMEScraper(BaseScraper):
             logger.warning(f"NME：頁面請求失敗: {e}")
             return tracks
 
-        soup = BeautifulSoup(resp.text, "lxml")
+        tree = parse_html(resp.text)
+        headings = _HEADING_LINKS(tree) if tree is not None else []
 
         # 從曲目評論列表頁提取標題
-        for heading in soup.select(
-            ".entry-title a, h3.entry-title a, .td_module_wrap .entry-title a"
-        )[:MAX_TRACKS_PER_SOURCE]:
-            text = self.clean_text(heading.get_text())
+        for heading in headings[:MAX_TRACKS_PER_SOURCE]:
+            text = self.clean_text(node_text(heading))
             if not text or len(text) < 5:
                 continue
 
@@ -54,6 +97,7 @@ class NMEScraper(BaseScraper):
         return unique
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _parse_nme_review_title(text: str) -> tuple[str, str] | None:
         """解析 NME 曲目評論標題，提取藝人與曲名。
 
@@ -75,23 +119,14 @@ class NMEScraper(BaseScraper):
         避免與所有格撇號混淆。
         """
         # 略過非曲目內容
-        lower = text.lower()
-        if any(
-            kw in lower
-            for kw in [
-                "interview",
-                "obituary",
-                "surprise",
-                "release is",
-            ]
-        ):
+        if _SKIP_RE.search(text.lower()):
             return None
 
         # === 使用 typographic 引號匹配曲名 ===
         # 優先匹配 U+2018...U+2019 (curly single quotes)
         # 或 U+201C...U+201D (curly double quotes)
         # 使用 negative lookahead (?![a-zA-Z]) 避免將縮寫的撇號（如 Where's）誤判為結尾引號
-        m = re.search(r"[\u2018\u201c](.+?)(?:\u2019(?![a-zA-Z])|\u201d)", text)
+        m = _QUOTE_RE.search(text)
         if not m:
             # 備選：「Artist – Title」格式
             return _parse_dash_format(text)
@@ -102,12 +137,7 @@ class NMEScraper(BaseScraper):
         suffix = text[m.end() :].strip()
 
         # 移除 title 中的 "review" 後綴（如果引號只包住了曲名部分）
-        title = re.sub(
-            r"\s*(?:review|single review|track review).*$",
-            "",
-            title,
-            flags=re.IGNORECASE,
-        ).strip()
+        title = _REVIEW_SUFFIX_RE.sub("", title).strip()
 
         # === 模式 A：標題以 "Is"/"On" 開頭，曲名在前，藝人在後 ===
         if prefix.lower() in ("is", "on", "with", "from", "for"):
@@ -127,21 +157,13 @@ class NMEScraper(BaseScraper):
 
         # === 模式 C：prefix 包含藝人名 ===
         # 移除 "Artist –" 格式的尾部
-        prefix = re.sub(r"\s*[–—-]\s*$", "", prefix).strip()
+        prefix = _DASH_TAIL_RE.sub("", prefix).strip()
 
-        # 移除 "filler" 詞：如 "new single", "new winter single", "new EP"
-        prefix = re.sub(
-            r"['\u2019]s?\s+(?:new\s+)?(?:winter\s+|debut\s+|latest\s+)?(?:single|EP|album|track|song|record|release)\s*$",
-            "",
-            prefix,
-            flags=re.IGNORECASE,
-        ).strip()
-
-        # 移除尾部的所有格 's 或 '
-        prefix = re.sub(r"['\u2019]s?\s*$", "", prefix).strip()
+        # 移除 "filler" 詞（如 "new single", "new winter single", "new EP"）與尾部的所有格 's 或 '
+        prefix = _PREFIX_TAIL_RE.sub("", prefix).strip()
 
         # 從 prefix 中提取藝人名（去除動詞片語）
-        artist = BaseScraper._extract_artist_before_verb(prefix, _VERB_RE)
+        artist = BaseScraper._extract_artist_before_verb(prefix, _VERBS)
 
         if artist and title:
             return artist, title
@@ -156,17 +178,8 @@ def _parse_dash_format(text: str) -> tuple[str, str] | None:
             parts = text.split(sep, 1)
             artist = parts[0].strip()
             title = parts[1].strip()
-            # 移除 "review" 後綴
-            title = re.sub(
-                r"\s*(?:review|single review|track review).*$",
-                "",
-                title,
-                flags=re.IGNORECASE,
-            ).strip()
-            # 移除引號
-            title = re.sub(
-                r"^[\u2018\u201c'\"]+|[\u2019\u201d'\"]+$", "", title
-            ).strip()
+            # 移除 "review" 後綴與引號
+            title = _DASH_TITLE_CLEAN_RE.sub("", title).strip()
             if artist and title:
                 return artist, title
     return None
@@ -181,53 +194,49 @@ def _extract_artist_from_suffix(suffix: str) -> str | None:
       - "by Kendrick Lamar is a masterpiece" → "Kendrick Lamar"
     """
     # 移除開頭的逗號和空白
-    suffix = re.sub(r"^[,\s]+", "", suffix).strip()
+    suffix = _LEADING_COMMA_RE.sub("", suffix).strip()
 
     # 模式 1：「for Artist」
-    for_m = re.search(r"\bfor\s+(.+?)(?:\s*[?!.]|\s*$)", suffix)
+    for_m = _FOR_RE.search(suffix)
     if for_m:
         artist = for_m.group(1).strip()
         # 移除尾部描述：「It's ...」
-        artist = re.sub(r"\?\s+.*$", "", artist).strip()
+        artist = _QUESTION_TAIL_RE.sub("", artist).strip()
         if artist:
             return artist
 
     # 模式 2：「by Artist」
-    by_m = re.search(r"\bby\s+(.+?)(?:\s*[-–—:?!.]|\s*$)", suffix)
+    by_m = _BY_RE.search(suffix)
     if by_m:
         return by_m.group(1).strip()
 
     # 模式 3：逗號後直接跟藝人名（如 ", Wolf Alice are..."）
     # 提取逗號後的第一組大寫字作為藝人名
-    comma_m = re.match(
-        r"^([A-Z][\w]*(?:\s+(?:and|&|the|of|The)\s+[A-Z][\w]*|"
-        r"\s+[A-Z][\w]*)*)",
-        suffix,
-    )
+    comma_m = _COMMA_NAME_RE.match(suffix)
     if comma_m:
         artist = comma_m.group(1).strip()
         # 用動詞清單截斷
-        artist = BaseScraper._extract_artist_before_verb(artist, _VERB_RE)
+        artist = BaseScraper._extract_artist_before_verb(artist, _VERBS)
         if artist:
             return artist
 
     return None
 
 
-# 動詞模式
-_VERB_RE = re.compile(
-    r"\b(?:"
-    r"takes?|brings?|makes?|finds?|sees?|drops?|gets?|puts?|"
-    r"shares?|unveils?|releases?|delivers?|debuts?|announces?|"
-    r"explores?|channels?|captures?|embraces?|confronts?|"
-    r"navigates?|returns?|continues?|celebrates?|"
-    r"soars?|dives?|rides?|rises?|leads?|"
-    r"opens?|closes?|plays?|feels?|moves?|gives?|"
-    r"joins?|teams?|taps?|hits?|cuts?|runs?|turns?|"
-    r"keeps?|holds?|stands?|tells?|calls?|shows?|"
-    r"wants?|needs?|looks?|creates?|builds?|picks?|"
-    r"reminds?|proves?|brings?|"
-    r"is|are|has|have|had|was|were|will|would|goes|go"
-    r")\b",
-    re.IGNORECASE,
-)
+# 動詞集合（小寫）
+_VERBS = frozenset({
+    "take", "takes", "bring", "brings", "make", "makes", "find", "finds", "see", "sees",
+    "drop", "drops", "get", "gets", "put", "puts", "share", "shares", "unveil",
+    "unveils", "release", "releases", "deliver", "delivers", "debut", "debuts",
+    "announce", "announces", "explore", "explores", "channel", "channels", "capture",
+    "captures", "embrace", "embraces", "confront", "confronts", "navigate", "navigates",
+    "return", "returns", "continue", "continues", "celebrate", "celebrates", "soar",
+    "soars", "dive", "dives", "ride", "rides", "rise", "rises", "lead", "leads", "open",
+    "opens", "close", "closes", "play", "plays", "feel", "feels", "move", "moves",
+    "give", "gives", "join", "joins", "team", "teams", "tap", "taps", "hit", "hits",
+    "cut", "cuts", "run", "runs", "turn", "turns", "keep", "keeps", "hold", "holds",
+    "stand", "stands", "tell", "tells", "call", "calls", "show", "shows", "want",
+    "wants", "need", "needs", "look", "looks", "create", "creates", "build", "builds",
+    "pick", "picks", "remind", "reminds", "prove", "proves", "is", "are", "has", "have",
+    "had", "was", "were", "will", "would", "goes", "go",
+})
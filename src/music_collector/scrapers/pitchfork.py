@@ -10,16 +10,32 @@
 
 import logging
 import re
+from itertools import islice
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from .base import BaseScraper, Track
+from .dom import node_text, parse_html
 from ..config import MAX_TRACKS_PER_SOURCE
 
 logger = logging.getLogger(__name__)
 
 URL = "https://pitchfork.com/reviews/best/tracks/"
 
+# 曲目容器與其中的曲名、藝人節點，等同 CSS 選擇器
+# 「div[class*='SummaryItemWrapper']」、「h3[class*='summary-item__hed']」、
+# 「div[class*='summary-item__sub-hed']」
+_ITEMS = etree.XPath("//div[contains(@class, 'SummaryItemWrapper')]")
+_ITEM_TITLE = etree.XPath(".//h3[contains(@class, 'summary-item__hed')]")
+_ITEM_ARTIST = etree.XPath(".//div[contains(@class, 'summary-item__sub-hed')]")
+# 備選策略：h3 父節點下第一個 div / span（等同「div, span」）
+_FIRST_DIV_OR_SPAN = etree.XPath("(.//*[self::div or self::span])[1]")
+
+# 曲名開頭、結尾，以及 [ft. ...] 等附加資訊前的引號
+_LEAD_QUOTE_RE = re.compile(r"^[\u2018\u2019\u201c\u201d\'\"]+")
+_TRAIL_QUOTE_RE = re.compile(r"[\u2018\u2019\u201c\u201d\'\"]+$")
+_QUOTE_BEFORE_BRACKET_RE = re.compile(r"[\u2018\u2019\u201c\u201d\'\"]+(\s*\[)")
+
 
 class PitchforkScraper(BaseScraper):
     name = "Pitchfork"
@@ -33,43 +49,47 @@ class PitchforkScraper(BaseScraper):
             logger.warning(f"Pitchfork：頁面請求失敗: {e}")
             return tracks
 
-        soup = BeautifulSoup(resp.text, "lxml")
+        tree = parse_html(resp.text)
+        if tree is None:
+            logger.warning("Pitchfork：頁面內容為空")
+            return tracks
 
         # 主要策略：從 SummaryItemWrapper 容器提取
         # 注意：只匹配 class 以 "SummaryItemWrapper" 開頭的 div，
         # 避免匹配到子元素（如 SummaryItemContent, SummaryItemAssetContainer）
-        items = soup.select("div[class*='SummaryItemWrapper']")
+        items = _ITEMS(tree)
 
         if items:
             for item in items[:MAX_TRACKS_PER_SOURCE]:
                 # 曲名：h3.summary-item__hed
-                title_el = item.select_one("h3[class*='summary-item__hed']")
+                title_els = _ITEM_TITLE(item)
                 # 藝人：div.summary-item__sub-hed
-                artist_el = item.select_one("div[class*='summary-item__sub-hed']")
+                artist_els = _ITEM_ARTIST(item)
 
-                if not title_el or not artist_el:
+                if not title_els or not artist_els:
                     continue
 
-                title = self._clean_title(self.clean_text(title_el.get_text()))
-                artist = self.clean_text(artist_el.get_text())
+                title = self._clean_title(self.clean_text(node_text(title_els[0])))
+                artist = self.clean_text(node_text(artist_els[0]))
 
                 if artist and title:
                     tracks.append(Track(artist=artist, title=title, source=self.name))
         else:
             # 備選策略：嘗試從所有 h3 + 相鄰元素提取
             logger.debug("Pitchfork：未找到 SummaryItemWrapper，嘗試備選策略")
-            for h3 in soup.select("h3")[:MAX_TRACKS_PER_SOURCE]:
-                text = self.clean_text(h3.get_text())
+            # 依標籤名逐一走訪，取到上限即停止，不需先收集所有 h3
+            for h3 in islice(tree.iter("h3"), MAX_TRACKS_PER_SOURCE):
+                text = self.clean_text(node_text(h3))
                 cleaned = self._clean_title(text)
                 if not cleaned:
                     continue
 
                 # 嘗試從相鄰元素取得藝人名
-                parent = h3.parent
-                if parent:
-                    sub = parent.select_one("div, span")
-                    if sub and sub != h3:
-                        artist = self.clean_text(sub.get_text())
+                parent = h3.getparent()
+                if parent is not None:
+                    subs = _FIRST_DIV_OR_SPAN(parent)
+                    if subs:
+                        artist = self.clean_text(node_text(subs[0]))
                         if artist and cleaned:
                             tracks.append(
                                 Track(artist=artist, title=cleaned, source=self.name)
@@ -87,9 +107,9 @@ class PitchforkScraper(BaseScraper):
         需要移除包裹曲名的引號，但保留 [ft. ...] 等附加資訊。
         """
         # 移除開頭的引號
-        text = re.sub(r"^[\u2018\u2019\u201c\u201d\'\"]+", "", text)
+        text = _LEAD_QUOTE_RE.sub("", text)
         # 移除結尾的引號
-        text = re.sub(r"[\u2018\u2019\u201c\u201d\'\"]+$", "", text)
+        text = _TRAIL_QUOTE_RE.sub("", text)
         # 移除曲名部分結尾的引號（在 [ft.] 等附加資訊前）
-        text = re.sub(r"[\u2018\u2019\u201c\u201d\'\"]+(\s*\[)", r"\1", text)
+        text = _QUOTE_BEFORE_BRACKET_RE.sub(r"\1", text)
         return text.strip()
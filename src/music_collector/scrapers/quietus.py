@@ -6,54 +6,41 @@
 """
 
 import logging
-
-import feedparser
+import re
 
 from .base import BaseScraper, Track
-from ..config import MAX_TRACKS_PER_SOURCE
 
 logger = logging.getLogger(__name__)
 
 FEED_URL = "https://thequietus.com/feed"
 
+# 樂評相關分類關鍵字（review 已涵蓋 reviews）
+_REVIEW_CATEGORY_RE = re.compile(r"review|albums|tracks|music")
+# 非藝人標題（如「The Quietus Guide to...」、「X Best Albums of...」）
+_SKIP_TITLE_RE = re.compile(r"guide to|best albums|best tracks|interview|in photos|playlist")
+
 
 class TheQuietusScraper(BaseScraper):
     name = "The Quietus"
 
     def fetch_tracks(self) -> list[Track]:
+        return self._fetch_feed_tracks(FEED_URL, self._parse_feed)
+
+    def _parse_feed(self, content: bytes) -> list[Track]:
         tracks: list[Track] = []
-        feed = feedparser.parse(FEED_URL)
+        items = self._feed_items(content)
 
-        if feed.bozo and not feed.entries:
+        if items is None:
             logger.warning("The Quietus RSS feed 解析失敗")
             return tracks
 
-        for entry in feed.entries[:MAX_TRACKS_PER_SOURCE]:
-            title_text = entry.get("title", "")
-            categories = [c.get("term", "").lower() for c in entry.get("tags", [])]
-
-            # 過濾樂評相關文章
-            is_review = any(
-                kw in cat
-                for cat in categories
-                for kw in ["reviews", "review", "albums", "tracks", "music"]
-            )
-            if not is_review:
+        for title_text, categories in items:
+            # 過濾樂評相關文章（關鍵字皆不含空白，合併後比對不會跨分類誤判）
+            if not _REVIEW_CATEGORY_RE.search(" ".join(categories)):
                 continue
 
-            # 跳過非藝人標題（如「The Quietus Guide to...」、「X Best Albums of...」）
-            lower = title_text.lower()
-            if any(
-                skip in lower
-                for skip in [
-                    "guide to",
-                    "best albums",
-                    "best tracks",
-                    "interview",
-                    "in photos",
-                    "playlist",
-                ]
-            ):
+            # 跳過非藝人標題
+            if _SKIP_TITLE_RE.search(title_text.lower()):
                 continue
 
             # The Quietus 標題通常為「Artist – Album」格式
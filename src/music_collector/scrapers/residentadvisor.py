@@ -8,9 +8,10 @@
 
 import logging
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from .base import BaseScraper, Track
+from .dom import node_text, parse_html
 from ..config import MAX_TRACKS_PER_SOURCE
 
 logger = logging.getLogger(__name__)
@@ -21,6 +22,16 @@ URLS = [
     "https://ra.co/tracks",
 ]
 
+# 曲目連結，等同 CSS 選擇器
+# 「li a, article a, [class*='track'] a, [class*='Track'] a, h3 a」（依文件順序、不重複）
+_TRACK_LINKS = etree.XPath(
+    "//li//a | //article//a"
+    " | //*[contains(@class, 'track') or contains(@class, 'Track')]//a"
+    " | //h3//a"
+)
+# 可見文字少於此字數時視為 JS 渲染空殼頁
+_MIN_VISIBLE_CHARS = 500
+
 
 class ResidentAdvisorScraper(BaseScraper):
     name = "Resident Advisor"
@@ -28,37 +39,31 @@ class ResidentAdvisorScraper(BaseScraper):
     def fetch_tracks(self) -> list[Track]:
         tracks: list[Track] = []
 
-        for url in URLS:
-            try:
-                resp = self._get(url)
-            except Exception:
+        # 同時下載所有候選頁面；仍依 URLS 順序處理，前一頁取得曲目即停止
+        for url, resp in zip(URLS, self._get_all(URLS)):
+            if resp is None:
                 continue
 
-            soup = BeautifulSoup(resp.text, "lxml")
+            tree = parse_html(resp.text)
 
-            # 偵測 JS 渲染：RA 為 Next.js 應用，靜態 HTML 幾乎無內容
-            body_text = soup.get_text(strip=True)
-            content_selectors = soup.select(
-                "li a, article a, [class*='track'] a, [class*='Track'] a, h3 a"
-            )
-            # 檢查是否有任何可解析為「藝人 – 曲名」的連結（而非僅導航連結）
+            # 偵測 JS 渲染：RA 為 Next.js 應用，靜態 HTML 幾乎無內容。
+            # 先檢查是否有任何可解析為「藝人 – 曲名」的連結（而非僅導航連結），
+            # SPA 空殼頁在此即判定，不需組出整頁可見文字
+            links = _TRACK_LINKS(tree) if tree is not None else []
             has_parseable = any(
-                self.parse_artist_title(self.clean_text(el.get_text()))
-                for el in content_selectors
-            )
-            needs_js = (
-                len(body_text) < 500
-                or self._is_js_blocked(body_text)
-                or not has_parseable
+                self.parse_artist_title(self.clean_text(node_text(el)))
+                for el in links
             )
+            needs_js = not has_parseable or self._looks_js_only(tree, _MIN_VISIBLE_CHARS)
             if needs_js:
                 # 嘗試 Playwright fallback
                 html = self._get_rendered(
                     url,
                     wait_selector="[class*='track'], [class*='Track'], article, li a",
                 )
-                if html:
-                    soup = BeautifulSoup(html, "lxml")
+                tree = parse_html(html) if html else None
+                if tree is not None:
+                    links = _TRACK_LINKS(tree)
                     logger.info("Resident Advisor：透過 Playwright 成功取得渲染頁面")
                 else:
                     logger.warning(
@@ -68,10 +73,8 @@ class ResidentAdvisorScraper(BaseScraper):
                     continue
 
             # RA 為 React 應用，嘗試從伺服器端渲染的 HTML 中提取
-            for item in soup.select(
-                "li a, article a, [class*='track'] a, [class*='Track'] a, h3 a"
-            )[:MAX_TRACKS_PER_SOURCE]:
-                text = self.clean_text(item.get_text())
+            for item in links[:MAX_TRACKS_PER_SOURCE]:
+                text = self.clean_text(node_text(item))
                 if not text or len(text) < 5:
                     continue
 
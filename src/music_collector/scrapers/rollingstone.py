@@ -11,9 +11,10 @@
 import logging
 import re
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from .base import BaseScraper, Track
+from .dom import node_text, parse_html
 from ..config import MAX_TRACKS_PER_SOURCE
 
 logger = logging.getLogger(__name__)
@@ -24,6 +25,36 @@ _BASE_URLS = [
     "https://www.rollingstone.com/music/music-features/",
 ]
 
+# 索引頁文章連結，等同 CSS 選擇器「h2 a, h3 a, .c-card__title a」（依文件順序、不重複）
+_INDEX_LINKS = etree.XPath(
+    "//h2//a | //h3//a"
+    " | //*[contains(concat(' ', normalize-space(@class), ' '), ' c-card__title ')]//a"
+)
+# 文章內文段落，等同 CSS 選擇器「p.paragraph, article p」
+_ARTICLE_PARAGRAPHS = etree.XPath(
+    "//p[contains(concat(' ', normalize-space(@class), ' '), ' paragraph ')] | //article//p"
+)
+
+# 推薦文章段落中的「Artist, "Title"」或「Artist, 'Title'」
+_ARTICLE_TRACK_RE = re.compile(r"([A-Z][\w\s.'\-]+?),\s*[\u201c\"']+(.+?)[\u201d\"']+")
+# 推薦標題：「Song You Need to Know: Artist — 'Title'」
+_NEED_TO_KNOW_RE = re.compile(
+    r".*(?:Need to (?:Know|Hear)|Song of the Week|Track of the Week)\s*:\s*"
+    r"(.+?)\s*[,–—-]\s*['\u2018\u201c\"]+(.+?)['\u2019\u201d\"]+",
+    re.IGNORECASE,
+)
+# 推薦標題：「First Listen: Artist — 'Title'」
+_FIRST_LISTEN_RE = re.compile(
+    r".*(?:First Listen|Premiere)\s*:\s*"
+    r"(.+?)\s*[,–—-]\s*['\u2018\u201c\"]+(.+?)['\u2019\u201d\"]+",
+    re.IGNORECASE,
+)
+# 推薦標題：「Artist Premieres/Debuts/Unveils New Song 'Title'」
+_PREMIERES_RE = re.compile(
+    r"^(.+?)\s+(?:Premieres?|Debuts?|Unveils?)"
+    r".*?['\u2018\u201c\"]+(.+?)['\u2019\u201d\"]+"
+)
+
 # 掃描頁數上限（推薦文章可能出現在 page 2-5）
 _MAX_PAGES = 3
 
@@ -66,6 +97,14 @@ _RECAP_KEYWORDS = [
     "all time",
 ]
 
+# 關鍵詞清單預先編譯為單一 alternation，每個標題只需掃描一次
+_RECAP_RE = re.compile("|".join(map(re.escape, _RECAP_KEYWORDS)))
+_RECOMMEND_TEXT_RE = re.compile("|".join(map(re.escape, _RECOMMEND_KEYWORDS)))
+# URL 中的推薦關鍵詞以連字號分隔（如 song-you-need）
+_RECOMMEND_HREF_RE = re.compile(
+    "|".join(re.escape(kw.replace(" ", "-")) for kw in _RECOMMEND_KEYWORDS)
+)
+
 
 class RollingStoneScraper(BaseScraper):
     name = "Rolling Stone"
@@ -82,8 +121,8 @@ class RollingStoneScraper(BaseScraper):
                     logger.warning(f"Rolling Stone：索引頁擷取失敗 {url}: {e}")
                     break
 
-                soup = BeautifulSoup(resp.text, "lxml")
-                new_tracks = self._scan_index(soup)
+                tree = parse_html(resp.text)
+                new_tracks = self._scan_index(tree) if tree is not None else []
                 tracks.extend(new_tracks)
 
                 if len(tracks) >= MAX_TRACKS_PER_SOURCE:
@@ -95,25 +134,24 @@ class RollingStoneScraper(BaseScraper):
         logger.info(f"Rolling Stone：找到 {len(tracks[:MAX_TRACKS_PER_SOURCE])} 首曲目")
         return tracks[:MAX_TRACKS_PER_SOURCE]
 
-    def _scan_index(self, soup: BeautifulSoup) -> list[Track]:
+    def _scan_index(self, tree: etree._Element) -> list[Track]:
         """掃描索引頁，僅篩選推薦類文章並提取曲目。"""
         tracks: list[Track] = []
         seen_urls: set[str] = set()
 
-        for link in soup.select("h2 a, h3 a, .c-card__title a"):
-            text = self.clean_text(link.get_text())
+        for link in _INDEX_LINKS(tree):
+            text = self.clean_text(node_text(link))
             href = link.get("href", "")
             text_lower = text.lower()
             href_lower = href.lower()
 
             # 跳過年度回顧
-            if any(kw in text_lower for kw in _RECAP_KEYWORDS):
+            if _RECAP_RE.search(text_lower):
                 continue
 
             # 必須是推薦類文章（標題或 URL 包含推薦關鍵詞）
-            is_recommend = any(
-                kw in text_lower or kw.replace(" ", "-") in href_lower
-                for kw in _RECOMMEND_KEYWORDS
+            is_recommend = bool(
+                _RECOMMEND_TEXT_RE.search(text_lower) or _RECOMMEND_HREF_RE.search(href_lower)
             )
             if not is_recommend and "songs-you-need" not in href_lower:
                 continue
@@ -148,17 +186,14 @@ class RollingStoneScraper(BaseScraper):
         而非使用 h2/h3 標題。
         """
         resp = self._get(url)
-        soup = BeautifulSoup(resp.text, "lxml")
+        tree = parse_html(resp.text)
         tracks: list[Track] = []
         seen: set[tuple[str, str]] = set()
 
-        for p in soup.select("p.paragraph, article p"):
-            text = self.clean_text(p.get_text())
+        for p in _ARTICLE_PARAGRAPHS(tree) if tree is not None else []:
+            text = self.clean_text(node_text(p))
             # 匹配「Artist, "Title"」或「Artist, 'Title'」
-            for m in re.finditer(
-                r"([A-Z][\w\s.'\-]+?),\s*[\u201c\"']+(.+?)[\u201d\"']+",
-                text,
-            ):
+            for m in _ARTICLE_TRACK_RE.finditer(text):
                 artist = m.group(1).strip()
                 title = m.group(2).strip()
                 key = (artist.lower(), title.lower())
@@ -177,31 +212,17 @@ class RollingStoneScraper(BaseScraper):
         - "Artist Premieres New Song 'Title'"
         """
         # 「Song You Need to Know: Artist — 'Title'」
-        m = re.match(
-            r".*(?:Need to (?:Know|Hear)|Song of the Week|Track of the Week)\s*:\s*"
-            r"(.+?)\s*[,–—-]\s*['\u2018\u201c\"]+(.+?)['\u2019\u201d\"]+",
-            text,
-            re.IGNORECASE,
-        )
+        m = _NEED_TO_KNOW_RE.match(text)
         if m:
             return m.group(1).strip(), m.group(2).strip()
 
         # 「First Listen: Artist — 'Title'」
-        m = re.match(
-            r".*(?:First Listen|Premiere)\s*:\s*"
-            r"(.+?)\s*[,–—-]\s*['\u2018\u201c\"]+(.+?)['\u2019\u201d\"]+",
-            text,
-            re.IGNORECASE,
-        )
+        m = _FIRST_LISTEN_RE.match(text)
         if m:
             return m.group(1).strip(), m.group(2).strip()
 
         # 「Artist Premieres/Debuts/Unveils New Song 'Title'」
-        m = re.match(
-            r"^(.+?)\s+(?:Premieres?|Debuts?|Unveils?)"
-            r".*?['\u2018\u201c\"]+(.+?)['\u2019\u201d\"]+",
-            text,
-        )
+        m = _PREMIERES_RE.match(text)
         if m:
             artist = m.group(1).strip().rstrip("'s").rstrip("\u2019s")
             title = m.group(2).strip()
@@ -22,6 +22,11 @@ URLS = [
     "https://www.slantmagazine.com/category/music/",
 ]
 
+# 非音樂內容（排行榜、訪談、影視評論等）
+_SKIP_RE = re.compile(r"best of|worst of|ranked|interview|the 25|film|tv")
+# 引號包裹的曲名（或專輯名）
+_QUOTED_TITLE_RE = re.compile(r"['\u2018\u201c\"]+(.+?)['\u2019\u201d\"]+")
+
 
 class SlantScraper(BaseScraper):
     name = "Slant"
@@ -52,18 +57,7 @@ class SlantScraper(BaseScraper):
                 text = self.clean_text(heading.get_text())
 
                 # 略過非音樂內容
-                if any(
-                    skip in text.lower()
-                    for skip in [
-                        "best of",
-                        "worst of",
-                        "ranked",
-                        "interview",
-                        "the 25",
-                        "film",
-                        "tv",
-                    ]
-                ):
+                if _SKIP_RE.search(text.lower()):
                     continue
 
                 # 只處理樂評標題（含 "Review"），排除新聞類標題
@@ -85,7 +79,7 @@ class SlantScraper(BaseScraper):
     def _parse_slant_title(text: str) -> tuple[str, str] | None:
         """解析 Slant 樂評標題，提取藝人與專輯/曲目名。"""
         # 從引號中提取專輯/曲名
-        m = re.search(r"['\u2018\u201c\"]+(.+?)['\u2019\u201d\"]+", text)
+        m = _QUOTED_TITLE_RE.search(text)
         if m:
             title = m.group(1).strip()
             artist = text[: m.start()].strip()
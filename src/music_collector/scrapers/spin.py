@@ -10,15 +10,40 @@
 import logging
 import re
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from .base import BaseScraper, Track
+from .dom import node_text, parse_html
 from ..config import MAX_TRACKS_PER_SOURCE
 
 logger = logging.getLogger(__name__)
 
 URL = "https://www.spinmagazine.com/new-music/"
 
+# 文章標題，等同 CSS 選擇器「h3.entry-title」
+_HEADINGS = etree.XPath(
+    "//h3[contains(concat(' ', normalize-space(@class), ' '), ' entry-title ')]"
+)
+
+# 非音樂內容（訪談、訃聞、巡演與活動新聞等）
+_SKIP_RE = re.compile(
+    r"interview|obituary|dies|dead|death|tour|festival|halftime|super bowl"
+    r"|teases new music|let it be"
+)
+# 彎引號包裹的曲名：U+2018...U+2019 或 U+201C...U+201D
+# negative lookahead (?![a-zA-Z]) 避免將縮寫的撇號誤判為結尾引號
+_QUOTE_RE = re.compile(r"[\u2018\u201c](.+?)(?:\u2019(?![a-zA-Z])|\u201d)")
+# 尾部的所有格 's 或 '（「On Artist's 'Title'」模式）
+_TRAILING_APOS_RE = re.compile(r"['\u2019]s?\s*$")
+# 尾部的所有格 's
+_POSSESSIVE_RE = re.compile(r"['\u2019]s\s*$")
+# 以數字開頭的 prefix（如「30 Years Later」）
+_LEADING_NUMBER_RE = re.compile(r"^\d+\s+")
+# prefix 尾部的 filler 詞，如 "With New EP"、"On Debut LP"
+_FILLER_RE = re.compile(
+    r"\s+(?:With\s+)?(?:New\s+|Debut\s+)?(?:EP|LP|Album|Single)\s*$", re.IGNORECASE
+)
+
 
 class SpinScraper(BaseScraper):
     name = "SPIN"
@@ -32,10 +57,11 @@ class SpinScraper(BaseScraper):
             logger.warning(f"SPIN：頁面請求失敗: {e}")
             return tracks
 
-        soup = BeautifulSoup(resp.text, "lxml")
+        tree = parse_html(resp.text)
+        headings = _HEADINGS(tree) if tree is not None else []
 
-        for heading in soup.select("h3.entry-title")[:MAX_TRACKS_PER_SOURCE]:
-            text = self.clean_text(heading.get_text())
+        for heading in headings[:MAX_TRACKS_PER_SOURCE]:
+            text = self.clean_text(node_text(heading))
             if not text or len(text) < 10:
                 continue
 
@@ -67,28 +93,12 @@ class SpinScraper(BaseScraper):
         策略：使用 typographic 引號定位曲名，再從前綴提取藝人名。
         """
         # 略過非音樂內容
-        lower = text.lower()
-        if any(
-            kw in lower
-            for kw in [
-                "interview",
-                "obituary",
-                "dies",
-                "dead",
-                "death",
-                "tour",
-                "festival",
-                "halftime",
-                "super bowl",
-                "teases new music",
-                "let it be",
-            ]
-        ):
+        if _SKIP_RE.search(text.lower()):
             return None
 
         # 從 typographic 引號中提取曲名
         # 使用 negative lookahead (?![a-zA-Z]) 避免將縮寫撇號（如 Where's）誤判為結尾引號
-        m = re.search(r"[\u2018\u201c](.+?)(?:\u2019(?![a-zA-Z])|\u201d)", text)
+        m = _QUOTE_RE.search(text)
         if not m:
             return None
 
@@ -105,28 +115,25 @@ class SpinScraper(BaseScraper):
             # "On Kelly Moran's 'Mirrors,'" → artist = "Kelly Moran"
             inner = prefix[3:].strip()  # 移除 "On "
             # 移除所有格
-            inner = re.sub(r"['\u2019]s?\s*$", "", inner).strip()
+            inner = _TRAILING_APOS_RE.sub("", inner).strip()
             if inner:
                 return inner, title
             return None
 
         # === 略過：prefix 以數字開頭或看起來不像藝人名 ===
-        if re.match(r"^\d+\s+", prefix) or not prefix:
+        if _LEADING_NUMBER_RE.match(prefix) or not prefix:
             return None
 
         # 移除所有格 's
-        prefix = re.sub(r"['\u2019]s\s*$", "", prefix).strip()
+        prefix = _POSSESSIVE_RE.sub("", prefix).strip()
 
         # 移除 filler 詞如 "With New EP", "On Debut LP"
-        prefix = re.sub(
-            r"\s+(?:With\s+)?(?:New\s+|Debut\s+)?(?:EP|LP|Album|Single)\s*$",
-            "",
-            prefix,
-            flags=re.IGNORECASE,
-        ).strip()
+        prefix = _FILLER_RE.sub("", prefix).strip()
 
         # 從 prefix 中提取藝人名（去除動詞片語）
-        artist = BaseScraper._extract_artist_before_verb(prefix, _VERB_RE)
+        artist = BaseScraper._extract_artist_before_verb(
+            prefix, _VERBS, ignore_case=False
+        )
 
         if artist and title:
             return artist, title
@@ -134,19 +141,22 @@ class SpinScraper(BaseScraper):
         return None
 
 
-# 動詞模式：用於辨識藝人名與描述文字的邊界
-_VERB_RE = re.compile(
-    r"\b(?:"
-    r"Takes?|Brings?|Makes?|Finds?|Sees?|Grows?|Drops?|Gets?|Puts?|"
-    r"Shares?|Unveils?|Releases?|Delivers?|Debuts?|Announces?|"
-    r"Explores?|Channels?|Captures?|Embraces?|Confronts?|"
-    r"Navigates?|Returns?|Continues?|Celebrates?|Enlivens?|"
-    r"Ascends?|Soars?|Dives?|Rides?|Rises?|Leads?|"
-    r"Opens?|Closes?|Plays?|Feels?|Moves?|Gives?|"
-    r"Joins?|Teams?|Taps?|Hits?|Cuts?|Runs?|Turns?|"
-    r"Keeps?|Holds?|Stands?|Tells?|Calls?|Shows?|"
-    r"Wants?|Needs?|Looks?|Creates?|Builds?|Picks?|"
-    r"Stays?|Dances?|Reminds?|Proves?|Lets?|"
-    r"Is|Are|Has|Have|Had|Was|Were|Will|Would|Still"
-    r")\b",
-)
+# 動詞集合（區分大小寫，僅比對首字大寫形式）：用於辨識藝人名與描述文字的邊界
+_VERBS = frozenset({
+    "Take", "Takes", "Bring", "Brings", "Make", "Makes", "Find", "Finds", "See", "Sees",
+    "Grow", "Grows", "Drop", "Drops", "Get", "Gets", "Put", "Puts", "Share", "Shares",
+    "Unveil", "Unveils", "Release", "Releases", "Deliver", "Delivers", "Debut",
+    "Debuts", "Announce", "Announces", "Explore", "Explores", "Channel", "Channels",
+    "Capture", "Captures", "Embrace", "Embraces", "Confront", "Confronts", "Navigate",
+    "Navigates", "Return", "Returns", "Continue", "Continues", "Celebrate",
+    "Celebrates", "Enliven", "Enlivens", "Ascend", "Ascends", "Soar", "Soars", "Dive",
+    "Dives", "Ride", "Rides", "Rise", "Rises", "Lead", "Leads", "Open", "Opens",
+    "Close", "Closes", "Play", "Plays", "Feel", "Feels", "Move", "Moves", "Give",
+    "Gives", "Join", "Joins", "Team", "Teams", "Tap", "Taps", "Hit", "Hits", "Cut",
+    "Cuts", "Run", "Runs", "Turn", "Turns", "Keep", "Keeps", "Hold", "Holds", "Stand",
+    "Stands", "Tell", "Tells", "Call", "Calls", "Show", "Shows", "Want", "Wants",
+    "Need", "Needs", "Look", "Looks", "Create", "Creates", "Build", "Builds", "Pick",
+    "Picks", "Stay", "Stays", "Dance", "Dances", "Remind", "Reminds", "Prove", "Proves",
+    "Let", "Lets", "Is", "Are", "Has", "Have", "Had", "Was", "Were", "Will", "Would",
+    "Still",
+})
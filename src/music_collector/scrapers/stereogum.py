@@ -11,10 +11,7 @@
 import logging
 import re
 
-import feedparser
-
 from .base import BaseScraper, Track
-from ..config import MAX_TRACKS_PER_SOURCE
 
 logger = logging.getLogger(__name__)
 
@@ -25,17 +22,17 @@ class StereogumScraper(BaseScraper):
     name = "Stereogum"
 
     def fetch_tracks(self) -> list[Track]:
+        return self._fetch_feed_tracks(FEED_URL, self._parse_feed)
+
+    def _parse_feed(self, content: bytes) -> list[Track]:
         tracks: list[Track] = []
-        feed = feedparser.parse(FEED_URL)
+        items = self._feed_items(content)
 
-        if feed.bozo and not feed.entries:
+        if items is None:
             logger.warning("Stereogum RSS feed 解析失敗")
             return tracks
 
-        for entry in feed.entries[:MAX_TRACKS_PER_SOURCE]:
-            title_text = entry.get("title", "")
-            categories = [c.get("term", "").lower() for c in entry.get("tags", [])]
-
+        for title_text, categories in items:
             # 過濾與曲目相關的文章（依分類標籤判斷）
             is_track = any(
                 kw in cat
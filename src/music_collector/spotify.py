@@ -6,6 +6,8 @@
 
 import logging
 import re
+import threading
+import time
 from datetime import datetime, timezone
 
 import spotipy
@@ -18,6 +20,7 @@ from .config import (
     SPOTIFY_CLIENT_ID,
     SPOTIFY_CLIENT_SECRET,
     SPOTIFY_REDIRECT_URI,
+    SPOTIFY_SEARCH_RATE,
     get_quarter,
 )
 
@@ -49,6 +52,64 @@ def get_spotify_client() -> spotipy.Spotify:
 # ── 搜尋與驗證 ──
 
 
+class _RateLimiter:
+    """執行緒安全的限流器：確保相鄰兩次請求至少間隔 1/rate 秒。
+
+    各執行緒在鎖內預約下一個可用時間點，鎖外再各自等待，
+    因此等待期間不會阻擋其他執行緒預約。
+    """
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            at = max(self._next_at, now)
+            self._next_at = at + self._interval
+        if at > now:
+            time.sleep(at - now)
+
+
+# 所有搜尋請求共用，供 main 以多執行緒並行搜尋時控制總請求速率
+_search_limiter = _RateLimiter(SPOTIFY_SEARCH_RATE)
+
+
+# 搜尋遇到 429 / 5xx 時的最大嘗試次數
+_SEARCH_MAX_ATTEMPTS = 5
+
+
+def _retry_delay(e: spotipy.SpotifyException, attempt: int) -> float | None:
+    """依錯誤類型計算重試前的等待秒數；不可重試的錯誤回傳 None。
+
+    429 優先採用 Retry-After 標頭，並以指數退避為下限；5xx 僅使用指數退避。
+    """
+    backoff = 2**attempt
+    if e.http_status == 429:
+        retry_after = str((e.headers or {}).get("Retry-After", ""))
+        return max(int(retry_after), backoff) if retry_after.isdigit() else backoff
+    if e.http_status >= 500:
+        return backoff
+    return None
+
+
+def _search(sp: spotipy.Spotify, query: str) -> dict:
+    """經限流後呼叫 Spotify 搜尋 API，遇到速率限制或伺服器錯誤時退避重試。"""
+    for attempt in range(_SEARCH_MAX_ATTEMPTS):
+        _search_limiter.wait()
+        try:
+            return sp.search(q=query, type="track", limit=5)
+        except spotipy.SpotifyException as e:
+            delay = _retry_delay(e, attempt)
+            if delay is None or attempt == _SEARCH_MAX_ATTEMPTS - 1:
+                raise
+            logger.warning(f"Spotify 搜尋暫時失敗（HTTP {e.http_status}），{delay} 秒後重試")
+            time.sleep(delay)
+    raise AssertionError("unreachable")
+
+
 def _normalize(text: str) -> str:
     """正規化文字：小寫、移除標點與多餘空白，用於比對。"""
     text = text.lower()
@@ -80,7 +141,7 @@ def _verify_result(
 
 
 def search_track(sp: spotipy.Spotify, artist: str, title: str) -> str | None:
-    """在 Spotify 搜尋曲目，回傳曲目 URI 或 None。
+    """在 Spotify 搜尋曲目，回傳曲目 URI 或 None。可由多個執行緒同時呼叫。
 
     搜尋策略：
     1. 精確搜尋：使用 track: 和 artist: 欄位限定
@@ -93,14 +154,14 @@ def search_track(sp: spotipy.Spotify, artist: str, title: str) -> str | None:
 
     # 第一步：精確搜尋
     query = f"track:{title} artist:{search_artist}"
-    results = sp.search(q=query, type="track", limit=5)
+    results = _search(sp, query)
     for item in results["tracks"]["items"]:
         if _verify_result(item, artist, title):
             return item["uri"]
 
     # 第二步：寬鬆搜尋（不帶欄位限定）
     query = f"{search_artist} {title}"
-    results = sp.search(q=query, type="track", limit=5)
+    results = _search(sp, query)
     for item in results["tracks"]["items"]:
         if _verify_result(item, artist, title):
             return item["uri"]
@@ -54,8 +54,6 @@ def show_overview() -> None:
             bar = "█" * min(r["cnt"], 50)
             print(f"  {r['day']}  {bar} {r['cnt']}")
 
-    conn.close()
-
 
 def show_overlap() -> None:
     """分析跨來源重疊：哪些曲目被多個來源同時推薦。"""
@@ -68,8 +66,6 @@ def show_overlap() -> None:
         "SELECT LOWER(artist) as a, LOWER(title) as t, source FROM tracks ORDER BY a, t"
     ).fetchall()
 
-    conn.close()
-
     if not rows:
         print("尚無蒐集資料。")
         return
@@ -117,8 +113,6 @@ def show_sources() -> None:
         "FROM tracks GROUP BY source ORDER BY total DESC"
     ).fetchall()
 
-    conn.close()
-
     if not rows:
         print("尚無蒐集資料。")
         return
@@ -7,7 +7,8 @@ import json
 import sqlite3
 import streamlit as st
 
-from .config import BACKUP_DIR, DB_PATH
+from .backup import backup_files, load_backup
+from .config import DB_PATH
 
 
 def _get_connection() -> sqlite3.Connection:
@@ -159,7 +160,7 @@ def page_backups() -> None:
     """季度備份瀏覽。"""
     st.header("📦 季度備份")
 
-    backups = sorted(BACKUP_DIR.glob("**/Q*.json"))
+    backups = backup_files()
 
     if not backups:
         st.info("尚無備份資料。執行完整蒐集後會自動建立備份。")
@@ -172,7 +173,7 @@ def page_backups() -> None:
     if selected:
         path = options[selected]
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            data = load_backup(path)
         except (json.JSONDecodeError, OSError):
             st.error("備份讀取失敗。")
             return
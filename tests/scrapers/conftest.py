@@ -4,6 +4,15 @@ import pytest
 import respx
 import httpx
 
+from music_collector.scrapers import base
+
+
+@pytest.fixture(autouse=True)
+def feed_cache_dir(tmp_path, monkeypatch):
+    """將 RSS 快取目錄指向暫存目錄，避免測試間共用快取。"""
+    monkeypatch.setattr(base, "FEED_CACHE_DIR", tmp_path / "feed_cache")
+    return tmp_path / "feed_cache"
+
 
 @pytest.fixture
 def mock_http():
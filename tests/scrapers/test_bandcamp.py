@@ -1,8 +1,10 @@
 """Bandcamp Daily 擷取器測試。"""
 
+import httpx
 import pytest
 
 from music_collector.scrapers.bandcamp import BandcampDailyScraper
+from music_collector.scrapers.base import Track
 
 
 class TestParseBandcampTitle:
@@ -39,3 +41,50 @@ class TestParseBandcampTitle:
     def test_parse_title(self, title, expected):
         result = BandcampDailyScraper._parse_bandcamp_title(title)
         assert result == expected
+
+
+FEED_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Bandcamp Daily</title>
+<item><title>Waxahatchee, "Tigers Blood"</title><category>Album of the Day</category></item>
+<item><title>Some Feature Story</title><category>Lists</category></item>
+</channel></rss>"""
+
+
+class TestBandcampDailyScraper:
+    """Bandcamp Daily 擷取器整合測試（RSS 經由 httpx 下載）。"""
+
+    def test_fetch_tracks(self, mock_http):
+        route = mock_http.get("https://daily.bandcamp.com/feed").mock(
+            return_value=httpx.Response(200, text=FEED_XML)
+        )
+
+        tracks = BandcampDailyScraper().fetch_tracks()
+
+        assert [(t.artist, t.title) for t in tracks] == [("Waxahatchee", "Tigers Blood")]
+        assert "Mozilla" in route.calls[0].request.headers["User-Agent"]
+
+    def test_fetch_tracks_http_error_raises(self, mock_http):
+        mock_http.get("https://daily.bandcamp.com/feed").mock(
+            return_value=httpx.Response(503)
+        )
+
+        with pytest.raises(httpx.HTTPStatusError):
+            BandcampDailyScraper().fetch_tracks()
+
+    def test_fetch_tracks_uses_cache_on_304(self, mock_http):
+        route = mock_http.get("https://daily.bandcamp.com/feed").mock(
+            side_effect=[
+                httpx.Response(200, text=FEED_XML, headers={"ETag": '"v1"'}),
+                httpx.Response(304),
+            ]
+        )
+        scraper = BandcampDailyScraper()
+
+        first = scraper.fetch_tracks()
+        second = scraper.fetch_tracks()
+
+        assert second == first == [
+            Track(artist="Waxahatchee", title="Tigers Blood", source="Bandcamp Daily")
+        ]
+        assert "If-None-Match" not in route.calls[0].request.headers
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
@@ -1,10 +1,21 @@
 """BaseScraper 基礎方法測試。"""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
+from music_collector.scrapers import base
 from music_collector.scrapers.base import BaseScraper, Track
 
 
+class _DummyScraper(BaseScraper):
+    name = "Dummy"
+
+    def fetch_tracks(self) -> list[Track]:
+        return []
+
+
 class TestParseArtistTitle:
     """parse_artist_title() 靜態方法測試。"""
 
@@ -17,6 +28,9 @@ class TestParseArtistTitle:
             ("Artist: Song Title", ("Artist", "Song Title")),
             ('  "Artist" – "Title"  ', ("Artist", "Title")),
             ("'Artist' – 'Title'", ("Artist", "Title")),
+            ("\u201cArtist\u201d – \u2018Title\u2019", ("Artist", "Title")),
+            ("Artist\u3000 – \u2009Title", ("Artist", "Title")),
+            ('" Artist " – Title', (" Artist ", "Title")),
             ("Only Text Without Separator", None),
             ("", None),
             (" – Title Only", None),
@@ -46,6 +60,34 @@ class TestCleanText:
         assert result == expected
 
 
+class TestExtractArtistBeforeVerb:
+    """_extract_artist_before_verb() 靜態方法測試。"""
+
+    _VERBS = frozenset({"shares", "is"})
+
+    @pytest.mark.parametrize(
+        "prefix, expected",
+        [
+            ("Wet Leg Shares", "Wet Leg"),
+            ("Wet Leg, is.", "Wet Leg,"),
+            ("Shares Nothing", "Shares Nothing"),  # 第一個字不視為動詞
+            ("Wet Leg", "Wet Leg"),
+            ("", ""),
+        ],
+    )
+    def test_ignore_case(self, prefix, expected):
+        assert BaseScraper._extract_artist_before_verb(prefix, self._VERBS) == expected
+
+    def test_case_sensitive(self):
+        verbs = frozenset({"Shares"})
+        assert BaseScraper._extract_artist_before_verb(
+            "Wet Leg shares", verbs, ignore_case=False
+        ) == "Wet Leg shares"
+        assert BaseScraper._extract_artist_before_verb(
+            "Wet Leg Shares", verbs, ignore_case=False
+        ) == "Wet Leg"
+
+
 class TestTrackDataclass:
     """Track 資料模型測試。"""
 
@@ -59,3 +101,87 @@ class TestTrackDataclass:
         t1 = Track(artist="A", title="B", source="S")
         t2 = Track(artist="A", title="B", source="S")
         assert t1 == t2
+
+    def test_track_is_hashable_and_immutable(self):
+        t = Track(artist="A", title="B", source="S")
+        assert {t, Track(artist="A", title="B", source="S")} == {t}
+        assert not hasattr(t, "__dict__")
+        with pytest.raises(AttributeError):
+            t.artist = "C"
+
+
+class TestGetRendered:
+    """_get_rendered() 共用瀏覽器測試（以假渲染函式取代 Playwright）。"""
+
+    def test_renders_on_single_shared_thread(self, monkeypatch):
+        threads = []
+
+        def fake_render(url, wait_selector):
+            threads.append(threading.get_ident())
+            return f"<html>{url}</html>"
+
+        monkeypatch.setattr(base, "ENABLE_PLAYWRIGHT", True)
+        monkeypatch.setattr(base, "find_spec", lambda name: object())
+        monkeypatch.setattr(base, "_render_page", fake_render)
+        scraper = _DummyScraper()
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            htmls = list(pool.map(scraper._get_rendered, ["a", "b", "c"]))
+        base.close_browser()
+
+        assert htmls == ["<html>a</html>", "<html>b</html>", "<html>c</html>"]
+        assert len(set(threads)) == 1
+        assert base._render_pool is None
+
+    def test_render_failure_returns_none(self, monkeypatch):
+        def fake_render(url, wait_selector):
+            raise RuntimeError("browser crashed")
+
+        monkeypatch.setattr(base, "ENABLE_PLAYWRIGHT", True)
+        monkeypatch.setattr(base, "find_spec", lambda name: object())
+        monkeypatch.setattr(base, "_render_page", fake_render)
+
+        assert _DummyScraper()._get_rendered("a") is None
+        base.close_browser()
+
+
+class TestFeedItems:
+    """_feed_items() RSS 解析測試。"""
+
+    RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel>
+<item><title>A &#8211; B</title><category>New Music</category><category>Tracks</category></item>
+<item><title><![CDATA[C - D]]></title></item>
+<item><title>E - F</title></item>
+</channel></rss>"""
+
+    def test_parses_title_and_categories(self):
+        assert BaseScraper._feed_items(self.RSS) == [
+            ("A – B", ["new music", "tracks"]),
+            ("C - D", []),
+            ("E - F", []),
+        ]
+
+    def test_stops_at_limit(self):
+        assert len(BaseScraper._feed_items(self.RSS, limit=2)) == 2
+
+    def test_falls_back_to_feedparser_for_atom(self):
+        atom = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+<entry><title>A - B</title><category term="Music"/></entry>
+</feed>"""
+        assert BaseScraper._feed_items(atom) == [("A - B", ["music"])]
+
+    def test_unparseable_returns_none(self):
+        assert BaseScraper._feed_items(b"not a feed") is None
+
+
+def test_scraper_classes_registry():
+    """測試註冊表回傳不重複名稱的擷取器類別，且重複呼叫共用同一個 tuple。"""
+    from music_collector.scrapers import scraper_classes
+
+    classes = scraper_classes()
+    assert isinstance(classes, tuple)
+    assert all(issubclass(cls, BaseScraper) for cls in classes)
+    assert len({cls.name for cls in classes}) == len(classes) == 13
+    assert scraper_classes() is classes
@@ -1,5 +1,7 @@
 """Complex 擷取器測試。"""
 
+import threading
+
 import respx
 import httpx
 from unittest.mock import patch
@@ -48,6 +50,27 @@ class TestComplexScraper:
         tracks = scraper.fetch_tracks()
         assert tracks == []
 
+    @respx.mock
+    def test_urls_fetched_concurrently(self):
+        """所有候選頁面同時下載（共用 barrier 需全部到齊才會放行），仍優先採用第一個 URL。"""
+        html = load_fixture("complex.html")
+        barrier = threading.Barrier(2)
+
+        def respond_with(text):
+            def respond(request):
+                barrier.wait(timeout=5)
+                return httpx.Response(200, text=text)
+            return respond
+
+        respx.get("https://www.complex.com/music").mock(side_effect=respond_with(html))
+        respx.get("https://www.complex.com/tag/best-new-music").mock(
+            side_effect=respond_with("")
+        )
+
+        tracks = ComplexScraper().fetch_tracks()
+
+        assert len(tracks) >= 2
+
     @respx.mock
     def test_all_urls_fail(self):
         respx.get("https://www.complex.com/music").mock(side_effect=Exception("fail"))
@@ -61,3 +84,32 @@ class TestComplexScraper:
         scraper = ComplexScraper()
         tracks = scraper.fetch_tracks()
         assert tracks == []
+
+    @respx.mock
+    @patch("music_collector.scrapers.base.ENABLE_PLAYWRIGHT", False)
+    def test_empty_document(self):
+        respx.get("https://www.complex.com/music").mock(
+            return_value=httpx.Response(200, text="")
+        )
+        respx.get("https://www.complex.com/tag/best-new-music").mock(
+            return_value=httpx.Response(200, text="")
+        )
+
+        scraper = ComplexScraper()
+        assert scraper.fetch_tracks() == []
+
+    @respx.mock
+    def test_template_text_does_not_hide_js_shell(self):
+        """<template> 內的文字不計入可見文字，空殼頁仍會嘗試 Playwright 渲染。"""
+        html = (
+            "<html><body><article><a href='/a'>Menu</a></article>"
+            "<template>" + "x" * 600 + "</template></body></html>"
+        )
+        respx.get("https://www.complex.com/music").mock(
+            return_value=httpx.Response(200, text=html)
+        )
+
+        scraper = ComplexScraper()
+        with patch.object(ComplexScraper, "_get_rendered", return_value=None) as rendered:
+            scraper.fetch_tracks()
+        assert rendered.called
@@ -50,6 +50,10 @@ class TestParseLOBFTitle:
             ),
             # 無引號
             ("No quotes in this title at all", None),
+            # 引號不在結尾
+            ("Phoebe Bridgers' 'Moon Song' gets a remix", None),
+            # 長串大寫字不觸發指數級回溯
+            ("A" * 60 + "! 'Song'", ("A" * 60 + "!", "Song")),
         ],
     )
     def test_parse_title(self, title, expected):
@@ -5,6 +5,7 @@ import httpx
 from unittest.mock import patch
 
 from tests.conftest import load_fixture
+from music_collector.scrapers.dom import parse_html
 from music_collector.scrapers.residentadvisor import ResidentAdvisorScraper
 
 
@@ -58,3 +59,7 @@ class TestResidentAdvisorScraper:
         scraper = ResidentAdvisorScraper()
         tracks = scraper.fetch_tracks()
         assert len(tracks) == 1
+
+    def test_js_detection_ignores_template_text(self):
+        html = "<html><body><template>" + "x" * 600 + "</template>short</body></html>"
+        assert ResidentAdvisorScraper._looks_js_only(parse_html(html), 500)
@@ -0,0 +1,137 @@
+"""季度備份模組測試。"""
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from music_collector import backup
+from music_collector.config import get_quarter
+from music_collector.scrapers.base import Track
+
+
+@pytest.fixture
+def backup_dir(tmp_path: Path, monkeypatch) -> Path:
+    """將備份目錄指向暫存目錄並清除清單快取。"""
+    monkeypatch.setattr(backup, "BACKUP_DIR", tmp_path)
+    monkeypatch.setattr(backup, "_files_cache", None)
+    return tmp_path
+
+
+def _current_quarter_file(backup_dir: Path, suffix: str = ".jsonl") -> Path:
+    now = datetime.now(UTC)
+    return backup_dir / str(now.year) / f"Q{get_quarter(now.month)}{suffix}"
+
+
+def test_save_backup_appends_jsonl_lines(backup_dir: Path) -> None:
+    """測試每首新曲目寫成一行 JSON，重複執行時只追加新曲目。"""
+    t1 = Track(artist="Radiohead", title="Creep", source="Pitchfork")
+    t2 = Track(artist="Björk", title="Jóga", source="NME")
+
+    backup.save_backup([t1], {("Radiohead", "Creep"): "spotify:track:1"})
+    backup.save_backup([t1, t2], {})
+
+    path = _current_quarter_file(backup_dir)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])["spotify_uri"] == "spotify:track:1"
+    assert "Björk" in lines[1]  # ensure_ascii=False
+
+
+def test_save_backup_migrates_legacy_json(backup_dir: Path) -> None:
+    """測試當季舊版 JSON 陣列備份會轉換為 JSONL 並參與去重。"""
+    legacy = _current_quarter_file(backup_dir, ".json")
+    legacy.parent.mkdir(parents=True)
+    legacy.write_text(
+        json.dumps([{"artist": "Radiohead", "title": "Creep", "source": "Pitchfork",
+                     "spotify_uri": None, "added_at": "2026-01-01T00:00:00"}]),
+        encoding="utf-8",
+    )
+
+    backup.save_backup([Track(artist="radiohead", title="creep", source="SPIN")], {})
+
+    assert not legacy.exists()
+    records = backup.load_backup(_current_quarter_file(backup_dir))
+    assert [r["source"] for r in records] == ["Pitchfork"]
+
+
+def test_save_backup_recovers_from_torn_last_line(backup_dir: Path) -> None:
+    """測試最後一行寫入中斷時仍以其餘紀錄去重，且新紀錄另起一行。"""
+    path = _current_quarter_file(backup_dir)
+    path.parent.mkdir(parents=True)
+    path.write_text(
+        '{"artist": "Radiohead", "title": "Creep", "source": "Pitchfork"}\n'
+        '{"artist": "Björk", "ti',
+        encoding="utf-8",
+    )
+
+    backup.save_backup([
+        Track(artist="Radiohead", title="Creep", source="SPIN"),
+        Track(artist="Caribou", title="Sun", source="NME"),
+    ], {})
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[1] == '{"artist": "Björk", "ti'
+    assert [r["artist"] for r in backup.load_backup(path)] == ["Radiohead", "Caribou"]
+
+
+def test_backup_files_lists_both_formats(backup_dir: Path) -> None:
+    """測試備份清單同時包含 .jsonl 與舊版 .json 檔案。"""
+    (backup_dir / "2025").mkdir()
+    (backup_dir / "2025" / "Q4.json").write_text("[]", encoding="utf-8")
+    (backup_dir / "2026").mkdir()
+    (backup_dir / "2026" / "Q1.jsonl").write_text("", encoding="utf-8")
+
+    names = [f"{f.parent.name}/{f.name}" for f in backup.backup_files()]
+    assert names == ["2025/Q4.json", "2026/Q1.jsonl"]
+
+
+def test_backup_files_cached_until_dir_changes(backup_dir: Path, monkeypatch) -> None:
+    """測試目錄未變動時不重新遞迴掃描，新增季度檔後清單更新。"""
+    (backup_dir / "2026").mkdir()
+    (backup_dir / "2026" / "Q1.jsonl").write_text("", encoding="utf-8")
+    assert len(backup.backup_files()) == 1
+
+    calls = []
+    real_glob = Path.glob
+    monkeypatch.setattr(Path, "glob", lambda self, p: calls.append(p) or real_glob(self, p))
+    assert len(backup.backup_files()) == 1
+    assert calls == []
+
+    (backup_dir / "2026" / "Q2.jsonl").write_text("", encoding="utf-8")
+    assert len(backup.backup_files()) == 2
+    assert calls
+
+
+def test_list_backups_counts_records(backup_dir: Path, capsys) -> None:
+    """測試備份清單顯示曲目數與 Spotify 配對數。"""
+    (backup_dir / "2026").mkdir()
+    (backup_dir / "2026" / "Q1.jsonl").write_text(
+        '{"artist": "A", "title": "B", "source": "S", "spotify_uri": "spotify:track:1"}\n'
+        '{"artist": "C", "title": "D", "source": "S", "spotify_uri": null}\n',
+        encoding="utf-8",
+    )
+
+    backup.list_backups()
+
+    assert "2026/Q1  —  2 首（Spotify 配對 1 首）" in capsys.readouterr().out
+
+
+def test_show_backup_summary_and_lines(backup_dir: Path, capsys) -> None:
+    """測試季度明細的統計摘要與逐首列表。"""
+    (backup_dir / "2026").mkdir()
+    (backup_dir / "2026" / "Q1.jsonl").write_text(
+        '{"artist": "A", "title": "B", "source": "NME", "spotify_uri": "spotify:track:1"}\n'
+        '{"artist": "C", "title": "D", "source": "NME", "spotify_uri": null}\n'
+        '{"artist": "E", "title": "F", "source": "SPIN", "spotify_uri": null}\n',
+        encoding="utf-8",
+    )
+
+    backup.show_backup("2026Q1")
+
+    out = capsys.readouterr().out
+    assert "2026/Q1 備份（共 3 首，Spotify 配對 1 首）" in out
+    assert "來源分布：NME 2, SPIN 1" in out
+    assert "    1. [✓] [NME] A — B" in out
+    assert "    3. [✗] [SPIN] E — F" in out
@@ -0,0 +1,175 @@
+"""資料庫模組測試。"""
+
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from music_collector import db
+
+
+@pytest.fixture
+def conn(tmp_path: Path, monkeypatch):
+    """建立指向暫存目錄的資料庫連線。"""
+    monkeypatch.setattr(db, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(db, "DB_PATH", tmp_path / "tracks.db")
+    connection = db.init_db()
+    yield connection
+    db.close_db()
+
+
+def test_save_tracks_inserts_all_rows(conn) -> None:
+    """測試批次寫入所有曲目，並去除前後空白。"""
+    db.save_tracks(conn, [
+        (" Radiohead ", "Creep ", "Pitchfork", "spotify:track:1"),
+        ("Massive Attack", "Teardrop", "NME", None),
+    ])
+
+    rows = conn.execute("SELECT artist, title, spotify_uri FROM tracks ORDER BY id").fetchall()
+    assert [tuple(r) for r in rows] == [
+        ("Radiohead", "Creep", "spotify:track:1"),
+        ("Massive Attack", "Teardrop", None),
+    ]
+
+
+def test_save_tracks_ignores_duplicates(conn) -> None:
+    """測試 UNIQUE 衝突的曲目被忽略。"""
+    with db.writer(conn):
+        db.save_track(conn, "Radiohead", "Creep", "Pitchfork", None)
+    db.save_tracks(conn, [("Radiohead", "Creep", "SPIN", "spotify:track:1")])
+
+    rows = conn.execute("SELECT source FROM tracks").fetchall()
+    assert [r["source"] for r in rows] == ["Pitchfork"]
+
+
+def test_existing_norm_keys_spans_batches(conn, monkeypatch) -> None:
+    """測試超過單批上限時分批查詢。"""
+    monkeypatch.setattr(db, "_EXISTS_BATCH", 2)
+    rows = [(f"A{i}", f"T{i}", "S", None) for i in range(5)]
+    db.save_tracks(conn, rows)
+    keys = [db.norm_key(a, t) for a, t, _, _ in rows]
+
+    found = db.existing_norm_keys(conn, keys + [db.norm_key("X", "Y")])
+
+    assert found == set(keys)
+    assert db.existing_norm_keys(conn, []) == set()
+
+
+def test_existing_norm_keys_matches_spelling_variants(conn) -> None:
+    """測試以正規化鍵查詢時，大小寫、變音符號與客串標記不同的寫法視為同一首。"""
+    db.save_tracks(conn, [("Björk", "Jóga", "NME", None)])
+
+    found = db.existing_norm_keys(conn, [
+        db.norm_key("bjork", "Joga (feat. X)"),
+        db.norm_key("Massive Attack", "Teardrop"),
+    ])
+
+    assert found == {db.norm_key("Björk", "Jóga")}
+
+
+@pytest.mark.parametrize(
+    ("a", "b"),
+    [
+        (("Radiohead", "Idioteque"), ("radiohead ", "IDIOTEQUE!")),
+        (("Beyoncé", "Déjà Vu"), ("Beyonce", "Deja Vu")),
+        (("Drake feat. Rihanna", "Too Good"), ("Drake", "Too Good (feat. Rihanna)")),
+        (("Drake", "Too Good ft. Rihanna"), ("Drake", "Too Good")),
+    ],
+)
+def test_track_key_merges_variants(a, b) -> None:
+    """測試不同寫法的同一首歌得到相同去重鍵。"""
+    assert db.track_key(*a) == db.track_key(*b)
+
+
+def test_track_key_keeps_versions_apart() -> None:
+    """測試 Remix 等版本標記不會被合併。"""
+    assert db.track_key("Caribou", "Sun") != db.track_key("Caribou", "Sun (Remix)")
+
+
+def test_track_key_keeps_punctuation_only_names() -> None:
+    """測試僅由標點組成的名稱不會正規化成空字串而彼此相撞。"""
+    assert db.track_key("!!!", "Song") == ("!!!", "song")
+    assert db.track_key("!!!", "Song") != db.track_key("???", "Song")
+
+
+def test_init_db_backfills_norm_key_for_old_schema(tmp_path: Path, monkeypatch) -> None:
+    """測試舊版資料庫（無 norm_key 欄位）開啟時自動加欄位並補齊既有列。"""
+    monkeypatch.setattr(db, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(db, "DB_PATH", tmp_path / "tracks.db")
+    old = sqlite3.connect(tmp_path / "tracks.db")
+    old.execute(
+        "CREATE TABLE tracks (id INTEGER PRIMARY KEY AUTOINCREMENT, artist TEXT NOT NULL, "
+        "title TEXT NOT NULL, source TEXT NOT NULL, spotify_uri TEXT, "
+        "added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, UNIQUE(artist, title))"
+    )
+    old.execute("INSERT INTO tracks (artist, title, source) VALUES ('Björk', 'Jóga', 'NME')")
+    old.commit()
+    old.close()
+
+    conn = db.init_db()
+    try:
+        assert db.existing_norm_keys(conn, [db.norm_key("Bjork", "Joga")]) == {
+            db.norm_key("Björk", "Jóga")
+        }
+    finally:
+        db.close_db()
+
+
+def test_init_db_enables_wal(conn) -> None:
+    """測試資料庫以 WAL 模式開啟。"""
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_existing_norm_keys_uses_index(conn) -> None:
+    """測試正規化曲目鍵查詢使用索引而非全表掃描，且不再建立舊版 LOWER() 索引。"""
+    plan = conn.execute(
+        "EXPLAIN QUERY PLAN SELECT DISTINCT norm_key FROM tracks WHERE norm_key IN (?)",
+        ("a\x1fb",),
+    ).fetchall()
+    assert any("idx_tracks_norm_key" in r["detail"] for r in plan)
+    indexes = {r["name"] for r in conn.execute("PRAGMA index_list(tracks)")}
+    assert "idx_tracks_lower" not in indexes
+
+
+def test_writer_commits_on_exit(conn) -> None:
+    """測試 writer 區塊結束時統一提交。"""
+    with db.writer(conn):
+        db.save_track(conn, "Radiohead", "Creep", "Pitchfork", None)
+        db.save_track(conn, "Massive Attack", "Teardrop", "NME", None)
+        assert conn.in_transaction
+
+    assert not conn.in_transaction
+    assert conn.execute("SELECT COUNT(*) FROM tracks").fetchone()[0] == 2
+
+
+def test_writer_rolls_back_on_error(conn) -> None:
+    """測試 writer 區塊發生例外時回滾所有寫入。"""
+    with pytest.raises(RuntimeError), db.writer(conn):
+        db.save_track(conn, "Radiohead", "Creep", "Pitchfork", None)
+        raise RuntimeError("boom")
+
+    assert conn.execute("SELECT COUNT(*) FROM tracks").fetchone()[0] == 0
+
+
+def test_get_recent_tracks_returns_named_tuples(conn) -> None:
+    """測試最近曲目以具名欄位回傳，且不影響連線原本的 Row 工廠。"""
+    db.save_tracks(conn, [("Radiohead", "Creep", "Pitchfork", "spotify:track:1")])
+    conn.execute("UPDATE tracks SET added_at = ?", (datetime.now().isoformat(),))
+
+    (track,) = db.get_recent_tracks(conn, days=7)
+
+    assert isinstance(track, db.RecentTrack)
+    assert (track.artist, track.title, track.spotify_uri) == ("Radiohead", "Creep", "spotify:track:1")
+    assert conn.row_factory is sqlite3.Row
+
+
+def test_init_db_reuses_connection(conn) -> None:
+    """測試同一行程重複呼叫 init_db() 取得同一條連線，close_db() 後重新開啟。"""
+    assert db.init_db() is conn
+
+    db.close_db()
+    reopened = db.init_db()
+
+    assert reopened is not conn
+    assert reopened.execute("SELECT COUNT(*) FROM tracks").fetchone()[0] == 0
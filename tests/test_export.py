@@ -0,0 +1,82 @@
+"""匯出模組測試。"""
+
+from pathlib import Path
+
+import pytest
+
+from music_collector import backup, export
+
+
+@pytest.fixture
+def backup_dir(tmp_path: Path, monkeypatch) -> Path:
+    """將備份目錄指向暫存目錄並清除索引快取。"""
+    monkeypatch.setattr(backup, "BACKUP_DIR", tmp_path)
+    monkeypatch.setattr(export, "BACKUP_DIR", tmp_path)
+    monkeypatch.setattr(backup, "_files_cache", None)
+    monkeypatch.setattr(export, "_backup_index", None)
+    return tmp_path
+
+
+def _write_quarter(backup_dir: Path, year: str, name: str) -> Path:
+    path = backup_dir / year / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("", encoding="utf-8")
+    return path
+
+
+class TestFindBackup:
+    """_find_backup() 查詢測試。"""
+
+    @pytest.mark.parametrize("query", ["2026Q1", "2026/Q1", "2026-q1"])
+    def test_full_label(self, backup_dir: Path, query: str) -> None:
+        _write_quarter(backup_dir, "2025", "Q1.json")
+        target = _write_quarter(backup_dir, "2026", "Q1.jsonl")
+        assert export._find_backup(query) == target
+
+    def test_quarter_only_returns_first_match(self, backup_dir: Path) -> None:
+        first = _write_quarter(backup_dir, "2025", "Q1.json")
+        _write_quarter(backup_dir, "2026", "Q1.jsonl")
+        assert export._find_backup("Q1") == first
+
+    def test_missing(self, backup_dir: Path) -> None:
+        _write_quarter(backup_dir, "2026", "Q1.jsonl")
+        assert export._find_backup("2026Q3") is None
+
+    def test_index_refreshes_after_new_file(self, backup_dir: Path) -> None:
+        _write_quarter(backup_dir, "2026", "Q1.jsonl")
+        assert export._find_backup("2026Q2") is None
+
+        target = _write_quarter(backup_dir, "2026", "Q2.jsonl")
+        assert export._find_backup("2026Q2") == target
+
+    def test_full_label_skips_scan(self, backup_dir: Path, monkeypatch) -> None:
+        """完整季度標籤直接組出路徑，不掃描備份目錄。"""
+        target = _write_quarter(backup_dir, "2026", "Q1.jsonl")
+
+        def fail():
+            raise AssertionError("不應掃描備份目錄")
+
+        monkeypatch.setattr(export, "backup_files", fail)
+        assert export._find_backup("2026Q1") == target
+
+
+def test_unsafe_filename_chars_replaced() -> None:
+    """測試檔名中不允許的字元皆替換為底線。"""
+    name = 'Critics\' Picks <A>:"B"/C\\D|E?F*'
+    assert name.translate(export._UNSAFE_FILENAME_CHARS) == "Critics' Picks _A___B__C_D_E_F_"
+
+
+def test_export_csv_writes_rows(backup_dir: Path, tmp_path: Path, monkeypatch) -> None:
+    """測試 CSV 匯出含標題列，且預設僅匯出 Spotify 已配對曲目。"""
+    monkeypatch.setattr(export, "EXPORT_DIR", tmp_path / "exports")
+    path = backup_dir / "2026" / "Q1.jsonl"
+    path.parent.mkdir(parents=True)
+    path.write_text(
+        '{"artist": "Radiohead", "title": "Creep", "source": "S", "spotify_uri": "spotify:track:1"}\n'
+        '{"artist": "Björk", "title": "Jóga", "source": "S", "spotify_uri": null}\n',
+        encoding="utf-8",
+    )
+
+    out = export.export_csv("2026Q1", playlist_name="Critics' Picks")
+
+    assert out.read_text(encoding="utf-8").splitlines() == ["Artist,Title", "Radiohead,Creep"]
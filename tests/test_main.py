@@ -0,0 +1,87 @@
+"""主流程模組測試。"""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from music_collector import db, main
+from music_collector.scrapers.base import Track
+
+
+class FakeScraper:
+    """測試用擷取器：回傳固定曲目，或拋出指定例外。"""
+
+    def __init__(self, name: str, tracks: list[Track], barrier=None, error=None):
+        self.name = name
+        self._tracks = tracks
+        self._barrier = barrier
+        self._error = error
+
+    def fetch_tracks(self) -> list[Track]:
+        if self._barrier is not None:
+            self._barrier.wait(timeout=5)
+        if self._error is not None:
+            raise self._error
+        return self._tracks
+
+
+@pytest.fixture
+def conn(tmp_path: Path, monkeypatch):
+    """將資料庫指向暫存目錄。"""
+    monkeypatch.setattr(db, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(db, "DB_PATH", tmp_path / "tracks.db")
+    connection = db.init_db()
+    yield connection
+    db.close_db()
+
+
+def test_collect_tracks_runs_scrapers_concurrently(conn, monkeypatch) -> None:
+    """測試所有擷取器同時執行（共用 barrier 需全部到齊才會放行）。"""
+    barrier = threading.Barrier(3)
+    scrapers = [
+        FakeScraper(f"S{i}", [Track(artist=f"A{i}", title="T", source=f"S{i}")], barrier)
+        for i in range(3)
+    ]
+    monkeypatch.setattr(main, "iter_scrapers", lambda: iter(scrapers))
+
+    tracks = main.collect_tracks(conn)
+
+    assert [t.artist for t in tracks] == ["A0", "A1", "A2"]
+
+
+def test_collect_tracks_dedups_and_records_health(conn, monkeypatch) -> None:
+    """測試跨來源與已紀錄曲目皆被去重，失敗來源記錄錯誤狀態。"""
+    db.save_tracks(conn, [("Radiohead", "Creep", "Pitchfork", None)])
+    scrapers = [
+        FakeScraper("NME", [
+            Track(artist="radiohead", title="creep", source="NME"),
+            Track(artist="Björk", title="Jóga", source="NME"),
+        ]),
+        FakeScraper("SPIN", [Track(artist="Björk ", title="Jóga", source="SPIN")]),
+        FakeScraper("Broken", [], error=RuntimeError("boom")),
+    ]
+    monkeypatch.setattr(main, "iter_scrapers", lambda: iter(scrapers))
+
+    tracks = main.collect_tracks(conn)
+
+    assert [(t.artist, t.source) for t in tracks] == [("Björk", "NME")]
+    rows = conn.execute("SELECT source, status FROM source_checks ORDER BY id").fetchall()
+    assert [tuple(r) for r in rows] == [
+        ("NME", "success"), ("SPIN", "success"), ("Broken", "failure"),
+    ]
+
+
+def test_collect_tracks_dedups_against_normalized_db_keys(conn, monkeypatch) -> None:
+    """測試已紀錄曲目的不同寫法（變音符號、客串標記）也視為已存在。"""
+    db.save_tracks(conn, [("Björk", "Jóga", "NME", None)])
+    scrapers = [FakeScraper("SPIN", [
+        Track(artist="Bjork", title="Joga", source="SPIN"),
+        Track(artist="Bjork feat. Someone", title="Joga", source="SPIN"),
+        Track(artist="Caribou", title="Sun", source="SPIN"),
+    ])]
+    monkeypatch.setattr(main, "iter_scrapers", lambda: iter(scrapers))
+
+    tracks = main.collect_tracks(conn)
+
+    assert [t.artist for t in tracks] == ["Caribou"]
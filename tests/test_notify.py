@@ -1,5 +1,12 @@
 """Notification message tests for manual import mode."""
 
+import threading
+
+import httpx
+import pytest
+import respx
+
+from music_collector import notify
 from music_collector.notify import _build_apple_music_message
 
 
@@ -27,3 +34,60 @@ def test_build_apple_music_message_failure() -> None:
     assert "Apple Music 檔案產出失敗" in message
     assert "原因：寫入權限不足" in message
     assert "請檢查執行日誌" in message
+
+
+@pytest.fixture
+def line_env(tmp_path, monkeypatch):
+    """設定 LINE 憑證並將 Token 快取指向暫存目錄。"""
+    monkeypatch.setattr(notify, "LINE_CHANNEL_ID", "channel")
+    monkeypatch.setattr(notify, "LINE_CHANNEL_SECRET", "secret")
+    monkeypatch.setattr(notify, "LINE_USER_ID", "user")
+    monkeypatch.setattr(notify, "LINE_TOKEN_CACHE_PATH", tmp_path / "line_token")
+    return tmp_path / "line_token"
+
+
+@respx.mock
+def test_line_token_cached_across_sends(line_env) -> None:
+    """測試 LINE Token 只在首次發送時產生，之後重用磁碟快取。"""
+    token_route = respx.post(notify.LINE_TOKEN_URL).mock(
+        return_value=httpx.Response(200, json={"access_token": "tok", "expires_in": 3600})
+    )
+    push_route = respx.post(notify.LINE_PUSH_URL).mock(return_value=httpx.Response(200))
+
+    notify._send_line("first")
+    notify._send_line("second")
+
+    assert token_route.call_count == 1
+    assert push_route.call_count == 2
+    assert push_route.calls[1].request.headers["Authorization"] == "Bearer tok"
+
+
+@respx.mock
+def test_line_token_refreshed_when_expired(line_env) -> None:
+    """測試快取 Token 即將到期時重新產生。"""
+    notify._save_cached_line_token("old", expires_in=30)
+    token_route = respx.post(notify.LINE_TOKEN_URL).mock(
+        return_value=httpx.Response(200, json={"access_token": "new", "expires_in": 3600})
+    )
+
+    assert notify._get_line_access_token() == "new"
+    assert token_route.call_count == 1
+
+
+def test_broadcast_sends_to_all_channels_concurrently(monkeypatch) -> None:
+    """測試三個通道同時發送（共用 barrier 需全部到齊才會放行）。"""
+    barrier = threading.Barrier(3)
+    sent = []
+
+    def sender(name):
+        def send(message):
+            barrier.wait(timeout=5)
+            sent.append((name, message))
+        return send
+
+    for name in ("_send_line", "_send_telegram", "_send_slack"):
+        monkeypatch.setattr(notify, name, sender(name))
+
+    notify.send_no_new_tracks_notification()
+
+    assert sorted(name for name, _ in sent) == ["_send_line", "_send_slack", "_send_telegram"]
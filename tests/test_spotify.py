@@ -1,5 +1,9 @@
 from unittest.mock import Mock
 
+import pytest
+from spotipy import SpotifyException
+
+from music_collector import spotify
 from music_collector.spotify import search_track
 
 
@@ -16,3 +20,57 @@ def test_search_track_uses_primary_artist_for_feature():
     sp.search.assert_called_once_with(
         q="track:La Monda artist:De La Rose", type="track", limit=5,
     )
+
+
+def test_rate_limiter_spaces_requests(monkeypatch):
+    clock = [100.0]
+    sleeps = []
+    monkeypatch.setattr(spotify.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(spotify.time, "sleep", sleeps.append)
+
+    limiter = spotify._RateLimiter(rate=4)
+    for _ in range(3):
+        limiter.wait()
+
+    assert sleeps == [0.25, 0.5]
+
+
+@pytest.fixture
+def no_wait(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(spotify._search_limiter, "wait", lambda: None)
+    monkeypatch.setattr(spotify.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def test_search_retries_after_rate_limit(no_wait):
+    item = {"name": "Creep", "artists": [{"name": "Radiohead"}], "uri": "spotify:track:1"}
+    sp = Mock()
+    sp.search.side_effect = [
+        SpotifyException(429, -1, "rate limited", headers={"Retry-After": "3"}),
+        SpotifyException(503, -1, "unavailable"),
+        {"tracks": {"items": [item]}},
+    ]
+
+    assert search_track(sp, "Radiohead", "Creep") == "spotify:track:1"
+    assert no_wait == [3, 2]
+
+
+def test_search_does_not_retry_client_errors(no_wait):
+    sp = Mock()
+    sp.search.side_effect = SpotifyException(400, -1, "bad request")
+
+    with pytest.raises(SpotifyException):
+        search_track(sp, "Radiohead", "Creep")
+    assert sp.search.call_count == 1
+    assert no_wait == []
+
+
+def test_search_gives_up_after_max_attempts(no_wait):
+    sp = Mock()
+    sp.search.side_effect = SpotifyException(429, -1, "rate limited")
+
+    with pytest.raises(SpotifyException):
+        search_track(sp, "Radiohead", "Creep")
+    assert sp.search.call_count == spotify._SEARCH_MAX_ATTEMPTS
+    assert no_wait == [1, 2, 4, 8]